@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures per call overhead of the hot _notcurses entry points.
+
+Run it on the build before and after a change to the C module
+and compare the nanoseconds per call.
+The terminal is acquired while measuring and the results are printed
+once notcurses releases it.
+"""
+from timeit import repeat
+from typing import Callable, Dict
+
+from notcurses import NcChannels, get_std_plane
+from notcurses._notcurses import (_nc_channels_set_foreground_rgb,
+                                  _nc_plane_dimensions_yx, _nc_plane_putstr,
+                                  _nc_plane_putstr_aligned,
+                                  _nc_plane_set_foreground_rgb)
+
+CALLS_NUM = 100_000
+
+std_plane = get_std_plane()
+raw_plane = std_plane._nc_plane
+raw_channels = NcChannels()._nc_channels
+
+benchmarks: Dict[str, Callable[[], object]] = {
+    '_nc_plane_putstr': lambda: _nc_plane_putstr(raw_plane, 'X', 0, 0),
+    '_nc_plane_putstr_aligned': lambda: _nc_plane_putstr_aligned(
+        raw_plane, 'X', 0, 0),
+    '_nc_plane_set_foreground_rgb': lambda: _nc_plane_set_foreground_rgb(
+        raw_plane, 10, 20, 30),
+    '_nc_plane_dimensions_yx': lambda: _nc_plane_dimensions_yx(raw_plane),
+    '_nc_channels_set_foreground_rgb': lambda: _nc_channels_set_foreground_rgb(
+        raw_channels, 10, 20, 30),
+}
+
+results: Dict[str, float] = {}
+for name, func in benchmarks.items():
+    best = min(repeat(func, number=CALLS_NUM, repeat=5))
+    results[name] = best * 1e9 / CALLS_NUM
+
+std_plane.context.stop()
+
+for name, ns_per_call in results.items():
+    print(f"{name:<35} {ns_per_call:8.1f} ns/call")
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures how long importing the module takes.
+
+Every statement runs in a new interpreter with ``-X importtime``.
+The best cumulative time of the top level import out of several runs
+and the slowest modules it pulled in are printed as JSON.
+
+Some statements must not pull in certain modules, for example
+importing NcDirect must not load the context and plane classes.
+The script exits with status 1 if any of them was imported.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+RUNS_NUM = 10
+SLOWEST_NUM = 5
+
+STATEMENTS = {
+    'import': 'import notcurses',
+    'direct': 'from notcurses import NcDirect',
+    'plane': 'from notcurses import get_std_plane',
+    'input_codes': 'from notcurses import NcInputCodes; NcInputCodes.ENTER',
+}
+
+# Modules that each statement is not allowed to import
+_HEAVY_MODULES = {
+    'notcurses.notcurses', 'array', 'collections', 'contextlib', 'enum',
+    'functools', 'itertools', 'threading', 'typing', 'weakref',
+}
+FORBIDDEN_MODULES = {
+    'import': _HEAVY_MODULES | {'notcurses._notcurses'},
+    'direct': _HEAVY_MODULES,
+}
+
+
+def _parse_import_time(stderr: str) -> List[Tuple[str, int, int, bool]]:
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Nested imports are indented by two more spaces
+        is_top_level = not name.startswith('  ')
+        modules.append(
+            (name.strip(), int(self_us), int(cumulative_us), is_top_level))
+    return modules
+
+
+def measure(name: str, statement: str) -> Dict[str, object]:
+    best_us = None
+    best_modules: List[Tuple[str, int, int, bool]] = []
+    for _ in range(RUNS_NUM):
+        stderr = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', statement],
+            stderr=subprocess.PIPE, check=True, text=True,
+        ).stderr
+        modules = [module for module in _parse_import_time(stderr)
+                   if module[0] not in _startup_modules]
+        total_us = sum(cumulative_us
+                       for _, _, cumulative_us, is_top_level in modules
+                       if is_top_level)
+        if best_us is None or total_us < best_us:
+            best_us = total_us
+            best_modules = modules
+
+    slowest = sorted(best_modules, key=lambda module: module[1],
+                     reverse=True)[:SLOWEST_NUM]
+    forbidden = FORBIDDEN_MODULES.get(name, set())
+    return {
+        'total_us': best_us,
+        'modules_num': len(best_modules),
+        'slowest_self_us': {module_name: self_us
+                            for module_name, self_us, _, _ in slowest},
+        'forbidden_modules': sorted(
+            module_name for module_name, _, _, _ in best_modules
+            if module_name in forbidden),
+    }
+
+
+# Modules imported by the interpreter startup are not counted
+_startup_modules = {
+    name for name, _, _, _ in _parse_import_time(subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'pass'],
+        stderr=subprocess.PIPE, check=True, text=True,
+    ).stderr)
+}
+
+
+def main() -> None:
+    results = {name: measure(name, statement)
+               for name, statement in STATEMENTS.items()}
+    print(json.dumps(results, indent=2))
+    if any(result['forbidden_modules'] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Performance suite that runs the bindings against a pseudo terminal.
+
+Every benchmark runs in a child process whose controlling terminal is
+the slave side of a new pty, so no real terminal is needed.
+The parent reads everything written to the pty, injects key presses
+for the input benchmark and prints the results as JSON.
+
+Usage::
+
+    python benchmarks/pty_suite.py [--rows 50] [--cols 200]
+        [--output results.json] [benchmark ...]
+
+Compare the JSON of two builds to see which one is faster.
+"""
+from __future__ import annotations
+
+import json
+import os
+import pty
+import select
+import struct
+import sys
+import traceback
+from argparse import ArgumentParser
+from fcntl import ioctl
+from statistics import mean, median
+from termios import TIOCSWINSZ
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from notcurses import NcDirect, get_std_plane
+
+Result = Dict[str, float]
+Report = Callable[[Dict[str, object]], None]
+
+PUTSTR_CALLS = 200_000
+PUT_LINES_FRAMES = 500
+RENDER_FRAMES = 200
+INPUT_EVENTS = 20_000
+DIRECT_WRITES = 20_000
+DIRECT_STRING = 'notcurses direct benchmark line of text 0123456789\n'
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _latency_result(samples: List[float]) -> Result:
+    return {
+        'frames': len(samples),
+        'mean_ms': mean(samples) * 1e3,
+        'median_ms': median(samples) * 1e3,
+        'p95_ms': _percentile(samples, 0.95) * 1e3,
+        'max_ms': max(samples) * 1e3,
+    }
+
+
+def bench_putstr(report: Report) -> Result:
+    std_plane = get_std_plane()
+    rows_num, cols_num = std_plane.dimensions_yx
+
+    start = perf_counter()
+    for i in range(PUTSTR_CALLS):
+        std_plane.putstr('X', i % rows_num, i % cols_num)
+    elapsed = perf_counter() - start
+
+    std_plane.context.stop()
+    return {
+        'calls': PUTSTR_CALLS,
+        'calls_per_sec': PUTSTR_CALLS / elapsed,
+    }
+
+
+def bench_put_lines(report: Report) -> Result:
+    std_plane = get_std_plane()
+    rows_num, cols_num = std_plane.dimensions_yx
+    frames = [
+        [chr(ord('a') + (row + frame) % 26) * cols_num
+         for row in range(rows_num)]
+        for frame in range(2)
+    ]
+
+    start = perf_counter()
+    for i in range(PUT_LINES_FRAMES):
+        std_plane.put_lines(frames[i % 2])
+    elapsed = perf_counter() - start
+
+    std_plane.context.stop()
+    lines_num = PUT_LINES_FRAMES * rows_num
+    return {
+        'lines': lines_num,
+        'lines_per_sec': lines_num / elapsed,
+        'cells_per_sec': lines_num * cols_num / elapsed,
+    }
+
+
+def bench_render_full(report: Report) -> Result:
+    std_plane = get_std_plane()
+    context = std_plane.context
+    rows_num, cols_num = std_plane.dimensions_yx
+    frames = [[char * cols_num] * rows_num for char in ('#', '.')]
+
+    samples: List[float] = []
+    context.stats(reset=True)
+    for i in range(RENDER_FRAMES):
+        std_plane.put_lines(frames[i % 2])
+        start = perf_counter()
+        context.render()
+        samples.append(perf_counter() - start)
+    render_bytes = context.stats().render_bytes
+
+    context.stop()
+    result = _latency_result(samples)
+    result['bytes_per_frame'] = render_bytes / RENDER_FRAMES
+    return result
+
+
+def bench_render_delta(report: Report) -> Result:
+    std_plane = get_std_plane()
+    context = std_plane.context
+    rows_num, cols_num = std_plane.dimensions_yx
+    std_plane.put_lines(['.' * cols_num] * rows_num)
+    context.render()
+
+    samples: List[float] = []
+    context.stats(reset=True)
+    for i in range(RENDER_FRAMES):
+        std_plane.putstr('#' if i % 2 else '.',
+                         i % rows_num, (i * 7) % cols_num)
+        start = perf_counter()
+        context.render()
+        samples.append(perf_counter() - start)
+    render_bytes = context.stats().render_bytes
+
+    context.stop()
+    result = _latency_result(samples)
+    result['bytes_per_frame'] = render_bytes / RENDER_FRAMES
+    return result
+
+
+def bench_input(report: Report) -> Result:
+    std_plane = get_std_plane()
+    context = std_plane.context
+
+    report({'inject': INPUT_EVENTS})
+    start = perf_counter()
+    events_num = 0
+    while events_num < INPUT_EVENTS:
+        batch = context.drain_input()
+        if len(batch) == 0:
+            context.get_input_blocking()
+            events_num += 1
+        events_num += len(batch)
+    elapsed = perf_counter() - start
+
+    context.stop()
+    return {
+        'events': events_num,
+        'events_per_sec': events_num / elapsed,
+    }
+
+
+def bench_direct(report: Report) -> Result:
+    nc_direct = NcDirect()
+    string_bytes = len(DIRECT_STRING.encode())
+
+    start = perf_counter()
+    for _ in range(DIRECT_WRITES):
+        nc_direct.putstr(DIRECT_STRING)
+    elapsed = perf_counter() - start
+
+    nc_direct.stop()
+    return {
+        'writes': DIRECT_WRITES,
+        'bytes_per_sec': DIRECT_WRITES * string_bytes / elapsed,
+    }
+
+
+BENCHMARKS: Dict[str, Callable[[Report], Result]] = {
+    'putstr': bench_putstr,
+    'put_lines': bench_put_lines,
+    'render_full': bench_render_full,
+    'render_delta': bench_render_delta,
+    'input': bench_input,
+    'direct': bench_direct,
+}
+
+
+def _run_child(name: str, rows_num: int, cols_num: int,
+               message_fd: int) -> None:
+    ioctl(pty.STDIN_FILENO, TIOCSWINSZ,
+          struct.pack('HHHH', rows_num, cols_num, 0, 0))
+    os.environ.setdefault('TERM', 'xterm-256color')
+
+    def report(message: Dict[str, object]) -> None:
+        os.write(message_fd, json.dumps(message).encode() + b'\n')
+
+    report({'result': BENCHMARKS[name](report)})
+
+
+def run_in_pty(name: str, rows_num: int, cols_num: int) -> Dict[str, object]:
+    """
+    Runs benchmark in a child process attached to a new pty
+
+    :returns: Benchmark result with number of bytes the child
+        wrote to the terminal.
+    """
+    message_read_fd, message_write_fd = os.pipe()
+    pid, master_fd = pty.fork()
+    if pid == 0:
+        exit_code = 0
+        try:
+            os.close(message_read_fd)
+            _run_child(name, rows_num, cols_num, message_write_fd)
+        except BaseException:
+            exit_code = 1
+            traceback.print_exc(file=sys.stderr)
+        finally:
+            os._exit(exit_code)
+
+    os.close(message_write_fd)
+    os.set_blocking(master_fd, False)
+
+    result: Dict[str, object] = {}
+    terminal_bytes = 0
+    pending_input = bytearray()
+    message_buffer = bytearray()
+    message_open = True
+    master_open = True
+    while message_open or master_open:
+        read_fds = [fd for fd, is_open in ((master_fd, master_open),
+                                           (message_read_fd, message_open))
+                    if is_open]
+        write_fds = [master_fd] if pending_input and master_open else []
+        readable, writable, _ = select.select(read_fds, write_fds, [])
+
+        if master_fd in readable:
+            try:
+                data = os.read(master_fd, 65536)
+            except OSError:
+                data = b''
+            if data:
+                terminal_bytes += len(data)
+            else:
+                master_open = False
+
+        if master_fd in writable:
+            try:
+                written = os.write(master_fd, pending_input[:4096])
+            except BlockingIOError:
+                written = 0
+            del pending_input[:written]
+
+        if message_read_fd in readable:
+            data = os.read(message_read_fd, 65536)
+            if not data:
+                message_open = False
+            message_buffer += data
+            while b'\n' in message_buffer:
+                line, _, rest = message_buffer.partition(b'\n')
+                message_buffer = bytearray(rest)
+                message = json.loads(line)
+                if 'inject' in message:
+                    pending_input += b'a' * message['inject']
+                if 'result' in message:
+                    result = message['result']
+
+    os.close(message_read_fd)
+    os.close(master_fd)
+    _, status = os.waitpid(pid, 0)
+    if not os.WIFEXITED(status) or os.WEXITSTATUS(status) != 0 or not result:
+        raise RuntimeError(f"Benchmark {name} failed")
+
+    result['terminal_bytes'] = terminal_bytes
+    return result
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description='Runs notcurses benchmarks in a pseudo terminal')
+    parser.add_argument('benchmarks', nargs='*',
+                        help=f"Benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--rows', type=int, default=50)
+    parser.add_argument('--cols', type=int, default=200)
+    parser.add_argument('--output', help='Write JSON to file')
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"Unknown benchmark: {name}")
+
+    results = {
+        'terminal': {'rows': args.rows, 'cols': args.cols},
+        'benchmarks': {
+            name: run_in_pty(name, args.rows, args.cols)
+            for name in (args.benchmarks or BENCHMARKS)
+        },
+    }
+
+    results_json = json.dumps(results, indent=2)
+    if args.output is None:
+        print(results_json)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(results_json + '\n')
+
+
+if __name__ == '__main__':
+    main()
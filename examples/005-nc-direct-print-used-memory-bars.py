@@ -13,31 +13,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Generator
+from notcurses import NcDirect
 
-from notcurses import NcChannels, NcDirect
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
 
 # Acquire the NcDirect plane
 nc_direct = NcDirect()
 nc_direct.cursor_enabled = False
-channels = NcChannels()
-channels.set_background_rgb(255, 0, 0)
-channels.set_foreground_rgb(0, 0, 0)
 
 # Get x dimensions, ignore y
 _, x_dimension = nc_direct.dimensions_yx
 
-# Function to generate the green to red line
-
-
-def red_line_gen(used_space: int = 0, percent: float = 1.0
-                 ) -> Generator[int, None, None]:
-    line_size = x_dimension - used_space  # How much space in the line we have
-    blocks_to_put = round(percent * line_size)  # How many blocks to fill
-    for x in range(blocks_to_put):
-        # Yeilds the integer on what to reduce green and increase red by
-        yield round(x * 255.0 / line_size)
-
 
 # Open the meminfo file
 with open('/proc/meminfo') as f:
@@ -59,12 +46,10 @@ mem_sting = f"Memory used: {round(100.0 * mem_percent_used)}% "
 
 nc_direct.putstr(mem_sting)  # Put the used memory
 
-for red_shift in red_line_gen(len(mem_sting), mem_percent_used):
-    # Get the red shift from the function and use it in red channel
-    # and subtract it from green
-    channels.set_background_rgb(red_shift, 255-red_shift, 0)
-    channels.set_foreground_rgb(red_shift, 255-red_shift, 0)
-    nc_direct.putstr('X', channels)
+# Put the green to red bar in the rest of the line
+# The colors of blocks are computed by notcurses module
+nc_direct.hbar(mem_percent_used, x_dimension - len(mem_sting),
+               GREEN, RED, 'X')
 
 nc_direct.putstr('\n')  # Finish line
 
@@ -81,9 +66,7 @@ if len(swap_string) < len(mem_sting):
 
 nc_direct.putstr(swap_string)
 
-for red_shift in red_line_gen(len(swap_string), swap_percent_used):
-    channels.set_background_rgb(red_shift, 255-red_shift, 0)
-    channels.set_foreground_rgb(red_shift, 255-red_shift, 0)
-    nc_direct.putstr('X', channels)
+nc_direct.hbar(swap_percent_used, x_dimension - len(swap_string),
+               GREEN, RED, 'X')
 
 nc_direct.putstr('\n')
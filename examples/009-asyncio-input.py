@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from asyncio import run
+
+from notcurses import NcInputCodes, get_std_plane
+
+
+async def main() -> None:
+    std_plane = get_std_plane()
+    context = std_plane.context
+    std_plane.putstr("Press keys. Press ENTER to exit.", y_pos=0, x_pos=0)
+    await context.render_async()
+
+    # Events are read when the input file descriptor becomes readable
+    async for nc_input in context.events():
+        if nc_input.code == NcInputCodes.ENTER:
+            break
+
+        std_plane.erase()
+        std_plane.putstr(f"Code point: {repr(nc_input.code)}",
+                         y_pos=0, x_pos=0)
+        await context.render_async()
+
+
+run(main())
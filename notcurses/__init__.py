@@ -13,12 +13,52 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
 
-from ._notcurses import get_notcurses_version
-from .notcurses import (NcAlign, NcChannels, NcDirect, NcInput, NcInputCodes,
-                        NcPlane, NotcursesContext, get_std_plane)
+# Attributes are imported on first use so that the C extension
+# and the classes are only loaded when they are needed.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from ._notcurses import get_notcurses_version
+    from .direct import NcChannels, NcDirect
+    from .input_codes import NcInputCodes
+    from .notcurses import (NcAlign, NcInput, NcInputBatch, NcLogLevel,
+                            NcPlane, NcPlanePool, NcPlaneSnapshot, NcScale,
+                            NcScrollingPlane, NcShadowPlane, NcStats,
+                            NcVirtualList, NotcursesContext, get_std_plane)
 
 __all__ = [
     'NcPlane', 'get_std_plane', 'NcAlign', 'NcInput', 'NcInputCodes',
-    'get_notcurses_version', 'NcDirect', 'NcChannels', 'NotcursesContext'
+    'get_notcurses_version', 'NcDirect', 'NcChannels', 'NotcursesContext',
+    'NcScale', 'NcInputBatch', 'NcStats', 'NcLogLevel', 'NcScrollingPlane',
+    'NcVirtualList', 'NcPlanePool', 'NcShadowPlane', 'NcPlaneSnapshot',
 ]
+
+
+# NcDirect users do not need the context and plane classes
+_DIRECT_ATTRIBUTES = ('NcDirect', 'NcChannels')
+
+
+def __getattr__(name: str) -> object:
+    if name == 'get_notcurses_version':
+        from . import _notcurses
+        attribute: object = _notcurses.get_notcurses_version
+    elif name in _DIRECT_ATTRIBUTES:
+        from . import direct
+        attribute = getattr(direct, name)
+    elif name == 'NcInputCodes':
+        from . import input_codes
+        attribute = input_codes.NcInputCodes
+    elif name in __all__:
+        from . import notcurses
+        attribute = getattr(notcurses, name)
+    else:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
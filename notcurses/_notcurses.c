@@ -16,6 +16,8 @@ limitations under the License.
 */
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include <stdio.h>
+#include <unistd.h>
 #include <notcurses/notcurses.h>
 #include <notcurses/direct.h>
 #include "structmember.h"
@@ -46,12 +48,17 @@ typedef struct
 {
     PyObject_HEAD;
     struct ncplane *ncplane_ptr;
+    PyObject *context_ref;
+    unsigned long context_generation;
+    bool is_owned;
 } NcPlaneObject;
 
 static PyMethodDef NcPlane_methods[] = {
     {NULL, NULL, 0, NULL},
 };
 
+static void NcPlane_dealloc(NcPlaneObject *self);
+
 static PyTypeObject NcPlaneType = {
     PyVarObject_HEAD_INIT(NULL, 0)
         .tp_name = "notcurses._notcurses._NcPlane",
@@ -61,6 +68,7 @@ static PyTypeObject NcPlaneType = {
     .tp_flags = Py_TPFLAGS_DEFAULT,
     .tp_new = PyType_GenericNew,
     .tp_init = NULL,
+    .tp_dealloc = (destructor)NcPlane_dealloc,
     .tp_methods = NcPlane_methods,
 };
 
@@ -69,12 +77,21 @@ typedef struct
     PyObject_HEAD;
     struct notcurses_options options;
     struct notcurses *notcurses_context_ptr;
+    FILE *output_file;
+    // Incremented on every stop so planes of previous sessions are detected
+    unsigned long generation;
+    // Planes garbage collected from Python, destroyed before the next render
+    struct ncplane **pending_destroys;
+    size_t pending_destroys_num;
+    size_t pending_destroys_capacity;
 } NotcursesContextObject;
 
 static PyMethodDef NotcursesContext_methods[] = {
     {NULL, NULL, 0, NULL},
 };
 
+static void NotcursesContext_dealloc(NotcursesContextObject *self);
+
 static PyTypeObject NotcursesContextType = {
     PyVarObject_HEAD_INIT(NULL, 0)
         .tp_name = "notcurses._notcurses._NotcursesContext",
@@ -83,9 +100,78 @@ static PyTypeObject NotcursesContextType = {
     .tp_itemsize = 0,
     .tp_flags = Py_TPFLAGS_DEFAULT,
     .tp_new = PyType_GenericNew,
+    .tp_dealloc = (destructor)NotcursesContext_dealloc,
     .tp_methods = NotcursesContext_methods,
 };
 
+static void
+NotcursesContext_dealloc(NotcursesContextObject *self)
+{
+    PyMem_Free(self->pending_destroys);
+    self->pending_destroys = NULL;
+    PyObject_Del(self);
+}
+
+static bool
+nc_plane_context_is_running(NcPlaneObject *nc_plane_ref)
+{
+    // Stopping notcurses destroys every plane, starting it again does not bring them back
+    NotcursesContextObject *context_ref = (NotcursesContextObject *)nc_plane_ref->context_ref;
+    return context_ref != NULL && context_ref->notcurses_context_ptr != NULL &&
+           context_ref->generation == nc_plane_ref->context_generation;
+}
+
+static void
+nc_context_destroy_pending(NotcursesContextObject *notcurses_context_ref)
+{
+    // Queued in the order planes were collected, so sub planes go before their parents
+    for (size_t i = 0; i < notcurses_context_ref->pending_destroys_num; ++i)
+    {
+        ncplane_destroy(notcurses_context_ref->pending_destroys[i]);
+    }
+    notcurses_context_ref->pending_destroys_num = 0;
+}
+
+static int
+nc_plane_check_alive(NcPlaneObject *nc_plane_ref)
+{
+    if (nc_plane_ref->ncplane_ptr == NULL || !nc_plane_context_is_running(nc_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "NcPlane was destroyed");
+        return 0;
+    }
+    return 1;
+}
+
+static void
+NcPlane_dealloc(NcPlaneObject *self)
+{
+    if (self->is_owned && self->ncplane_ptr != NULL && nc_plane_context_is_running(self))
+    {
+        // Dealloc can run while another thread renders without the GIL,
+        // so the plane is destroyed by the next call made under the context lock
+        NotcursesContextObject *context_ref = (NotcursesContextObject *)self->context_ref;
+        if (context_ref->pending_destroys_num == context_ref->pending_destroys_capacity)
+        {
+            size_t new_capacity = context_ref->pending_destroys_capacity ? context_ref->pending_destroys_capacity * 2 : 16;
+            struct ncplane **new_pending = PyMem_Realloc(context_ref->pending_destroys, new_capacity * sizeof(struct ncplane *));
+            if (new_pending != NULL)
+            {
+                context_ref->pending_destroys = new_pending;
+                context_ref->pending_destroys_capacity = new_capacity;
+            }
+        }
+        // Without memory the plane is left to notcurses_stop
+        if (context_ref->pending_destroys_num < context_ref->pending_destroys_capacity)
+        {
+            context_ref->pending_destroys[context_ref->pending_destroys_num++] = self->ncplane_ptr;
+        }
+    }
+    self->ncplane_ptr = NULL;
+    Py_XDECREF(self->context_ref);
+    PyObject_Del(self);
+}
+
 typedef struct
 {
     PyObject_HEAD;
@@ -146,8 +232,102 @@ static PyTypeObject NcInputType = {
     //.tp_alloc = PyType_GenericAlloc,
 };
 
+typedef struct
+{
+    PyObject_HEAD;
+    ncstats stats;
+} NcStatsObject;
+
+static PyMemberDef NcStats_members[] = {
+    {"renders", T_ULONGLONG, offsetof(NcStatsObject, stats.renders), READONLY, "Successful renders"},
+    {"failed_renders", T_ULONGLONG, offsetof(NcStatsObject, stats.failed_renders), READONLY, "Failed renders"},
+    {"render_bytes", T_ULONGLONG, offsetof(NcStatsObject, stats.render_bytes), READONLY, "Bytes written to terminal"},
+    {"render_max_bytes", T_LONGLONG, offsetof(NcStatsObject, stats.render_max_bytes), READONLY, "Maximum bytes written in a frame"},
+    {"render_min_bytes", T_LONGLONG, offsetof(NcStatsObject, stats.render_min_bytes), READONLY, "Minimum bytes written in a frame"},
+    {"render_ns", T_ULONGLONG, offsetof(NcStatsObject, stats.render_ns), READONLY, "Nanoseconds spent rendering"},
+    {"render_max_ns", T_LONGLONG, offsetof(NcStatsObject, stats.render_max_ns), READONLY, "Maximum nanoseconds spent rendering a frame"},
+    {"render_min_ns", T_LONGLONG, offsetof(NcStatsObject, stats.render_min_ns), READONLY, "Minimum nanoseconds spent rendering a frame"},
+    {"cell_elisions", T_ULONGLONG, offsetof(NcStatsObject, stats.cellelisions), READONLY, "Cells elided"},
+    {"cell_emissions", T_ULONGLONG, offsetof(NcStatsObject, stats.cellemissions), READONLY, "Cells emitted"},
+    {"fg_elisions", T_ULONGLONG, offsetof(NcStatsObject, stats.fgelisions), READONLY, "Foreground colors elided"},
+    {"fg_emissions", T_ULONGLONG, offsetof(NcStatsObject, stats.fgemissions), READONLY, "Foreground colors emitted"},
+    {"bg_elisions", T_ULONGLONG, offsetof(NcStatsObject, stats.bgelisions), READONLY, "Background colors elided"},
+    {"bg_emissions", T_ULONGLONG, offsetof(NcStatsObject, stats.bgemissions), READONLY, "Background colors emitted"},
+    {"framebuffer_bytes", T_ULONGLONG, offsetof(NcStatsObject, stats.fbbytes), READONLY, "Bytes used by framebuffers"},
+    {"planes", T_UINT, offsetof(NcStatsObject, stats.planes), READONLY, "Number of planes"},
+    {NULL}};
+
+static PyMethodDef NcStats_methods[] = {
+    {NULL, NULL, 0, NULL},
+};
+
+static PyTypeObject NcStatsType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+        .tp_name = "notcurses._notcurses._NcStats",
+    .tp_doc = "Notcurses Statistics",
+    .tp_basicsize = sizeof(NcStatsObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_members = NcStats_members,
+    .tp_methods = NcStats_methods,
+};
+
 // Functions
 
+/* Helpers for METH_FASTCALL functions
+
+Hot functions receive their arguments as a C array instead of a tuple
+and convert them directly, skipping PyArg_ParseTuple format parsing.
+Return 1 on success and 0 on failure.
+*/
+static int
+fastcall_parse_int(PyObject *arg, int *value)
+{
+    long long_value = PyLong_AsLong(arg);
+    if (long_value == -1 && PyErr_Occurred())
+    {
+        return 0;
+    }
+    if (long_value < INT_MIN || long_value > INT_MAX)
+    {
+        return 0;
+    }
+    *value = (int)long_value;
+    return 1;
+}
+
+/* Helpers for bars and gradients
+
+Colors are passed from Python as (red, green, blue) tuples.
+*/
+static unsigned
+nc_rgb_interpolate(const int from_rgb[3], const int to_rgb[3], int step, int steps_num)
+{
+    unsigned packed_rgb = 0;
+    for (int i = 0; i < 3; ++i)
+    {
+        int component = steps_num > 0 ? from_rgb[i] + (to_rgb[i] - from_rgb[i]) * step / steps_num : from_rgb[i];
+        component = component < 0 ? 0 : (component > 255 ? 255 : component);
+        packed_rgb = (packed_rgb << 8) | (unsigned)component;
+    }
+    return packed_rgb;
+}
+
+static int
+nc_bar_blocks_num(double value, int width)
+{
+    if (value <= 0.0)
+    {
+        return 0;
+    }
+    if (value >= 1.0)
+    {
+        return width;
+    }
+    return (int)(value * width + 0.5);
+}
+
 /* Prototype
 
 static PyObject *
@@ -246,7 +426,10 @@ _nc_direct_putstr(PyObject *self, PyObject *args)
         return NULL;
     }
 
-    int return_code = ncdirect_putstr(ncdirect_ref->ncdirect_ptr, channels, string);
+    int return_code = 0;
+    Py_BEGIN_ALLOW_THREADS
+    return_code = ncdirect_putstr(ncdirect_ref->ncdirect_ptr, channels, string);
+    Py_END_ALLOW_THREADS
     if (return_code >= 0)
     {
         return PyLong_FromLong(return_code);
@@ -258,6 +441,173 @@ _nc_direct_putstr(PyObject *self, PyObject *args)
     }
 }
 
+typedef struct
+{
+    size_t offset;
+    uint64_t channels;
+} NcDirectSegment;
+
+static PyObject *
+_nc_direct_putstr_many(PyObject *self, PyObject *args)
+{
+    NcDirectObject *ncdirect_ref = NULL;
+    PyObject *runs_object = NULL;
+    if (!PyArg_ParseTuple(args, "O!O",
+                          &NcDirectType, &ncdirect_ref,
+                          &runs_object))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_direct_putstr_many arguments");
+        return NULL;
+    }
+    PyObject *runs_fast = PySequence_Fast(runs_object, "Runs must be a sequence");
+    if (runs_fast == NULL)
+    {
+        return NULL;
+    }
+    Py_ssize_t runs_num = PySequence_Fast_GET_SIZE(runs_fast);
+    PyObject **runs = PySequence_Fast_ITEMS(runs_fast);
+
+    // Copy the text while holding the GIL, merging runs that share channels
+    NcDirectSegment *segments = PyMem_New(NcDirectSegment, runs_num > 0 ? runs_num : 1);
+    char *text_buffer = NULL;
+    size_t text_len = 0;
+    size_t text_capacity = 0;
+    Py_ssize_t segments_num = 0;
+    if (segments == NULL)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+    for (Py_ssize_t i = 0; i < runs_num; ++i)
+    {
+        const char *string = NULL;
+        Py_ssize_t string_len = 0;
+        unsigned long long channels = 0;
+        if (!PyArg_ParseTuple(runs[i], "s#K", &string, &string_len, &channels))
+        {
+            PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_direct_putstr_many run");
+            goto error;
+        }
+        // Segments are NUL terminated, so a NUL would silently cut the rest off
+        if (memchr(string, '\0', (size_t)string_len) != NULL)
+        {
+            PyErr_SetString(PyExc_ValueError, "embedded null character");
+            goto error;
+        }
+        int new_segment = segments_num == 0 || segments[segments_num - 1].channels != channels;
+        size_t needed = text_len + (size_t)string_len + 2;
+        if (needed > text_capacity)
+        {
+            size_t new_capacity = text_capacity > 0 ? text_capacity * 2 : 256;
+            while (new_capacity < needed)
+            {
+                new_capacity *= 2;
+            }
+            char *new_buffer = PyMem_Realloc(text_buffer, new_capacity);
+            if (new_buffer == NULL)
+            {
+                PyErr_NoMemory();
+                goto error;
+            }
+            text_buffer = new_buffer;
+            text_capacity = new_capacity;
+        }
+        if (new_segment)
+        {
+            if (segments_num > 0)
+            {
+                text_buffer[text_len++] = '\0';
+            }
+            segments[segments_num].offset = text_len;
+            segments[segments_num].channels = channels;
+            ++segments_num;
+        }
+        memcpy(text_buffer + text_len, string, (size_t)string_len);
+        text_len += (size_t)string_len;
+    }
+    if (text_buffer != NULL)
+    {
+        text_buffer[text_len] = '\0';
+    }
+    Py_DECREF(runs_fast);
+
+    int return_code = 0;
+    long chars_written = 0;
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < segments_num; ++i)
+    {
+        return_code = ncdirect_putstr(ncdirect_ref->ncdirect_ptr, segments[i].channels, text_buffer + segments[i].offset);
+        if (return_code < 0)
+        {
+            break;
+        }
+        chars_written += return_code;
+    }
+    fflush(stdout);
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(segments);
+    PyMem_Free(text_buffer);
+    if (return_code < 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed put string on NcDirect");
+        return NULL;
+    }
+    return PyLong_FromLong(chars_written);
+
+error:
+    Py_DECREF(runs_fast);
+    PyMem_Free(segments);
+    PyMem_Free(text_buffer);
+    return NULL;
+}
+
+static PyObject *
+_nc_direct_hbar(PyObject *self, PyObject *args)
+{
+    NcDirectObject *ncdirect_ref = NULL;
+    double value = 0.0;
+    int width = 0;
+    int from_rgb[3] = {0};
+    int to_rgb[3] = {0};
+    const char *fill = NULL;
+    if (!PyArg_ParseTuple(args, "O!di(iii)(iii)s",
+                          &NcDirectType, &ncdirect_ref,
+                          &value, &width,
+                          &from_rgb[0], &from_rgb[1], &from_rgb[2],
+                          &to_rgb[0], &to_rgb[1], &to_rgb[2],
+                          &fill))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_direct_hbar arguments");
+        return NULL;
+    }
+
+    int blocks_num = nc_bar_blocks_num(value, width);
+    int return_code = 0;
+    Py_BEGIN_ALLOW_THREADS
+    for (int i = 0; i < blocks_num; ++i)
+    {
+        unsigned block_rgb = nc_rgb_interpolate(from_rgb, to_rgb, i, width - 1);
+        uint64_t channels = 0;
+        channels_set_fg_rgb(&channels, block_rgb);
+        channels_set_bg_rgb(&channels, block_rgb);
+        if (ncdirect_putstr(ncdirect_ref->ncdirect_ptr, channels, fill) < 0)
+        {
+            return_code = -1;
+            break;
+        }
+    }
+    fflush(stdout);
+    Py_END_ALLOW_THREADS
+
+    if (return_code != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed put bar on NcDirect");
+        return NULL;
+    }
+    return PyLong_FromLong(blocks_num);
+}
+
 static PyObject *
 _nc_direct_get_dim_x(PyObject *self, PyObject *args)
 {
@@ -342,25 +692,21 @@ _nc_direct_enable_cursor(PyObject *self, PyObject *args)
 // NcChannels
 
 static PyObject *
-_nc_channels_set_background_rgb(PyObject *self, PyObject *args)
+_nc_channels_set_background_rgb(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    NcChannelsObject *nchannels_ref = NULL;
     int red = 0;
     int green = 0;
     int blue = 0;
-    if (!PyArg_ParseTuple(args, "O!iii",
-                          &NcChannelsType, &nchannels_ref,
-                          &red, &green, &blue))
+    if (nargs != 4 ||
+        !PyObject_TypeCheck(args[0], &NcChannelsType) ||
+        !fastcall_parse_int(args[1], &red) ||
+        !fastcall_parse_int(args[2], &green) ||
+        !fastcall_parse_int(args[3], &blue))
     {
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _ncchannels_set_background_rgb arguments");
         return NULL;
     }
-
-    if (nchannels_ref == NULL)
-    {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire NcChannelsObject");
-        return NULL;
-    }
+    NcChannelsObject *nchannels_ref = (NcChannelsObject *)args[0];
 
     int return_code = channels_set_bg_rgb8(&(nchannels_ref->ncchannels_ptr), red, green, blue);
     if (return_code != 0)
@@ -372,25 +718,21 @@ _nc_channels_set_background_rgb(PyObject *self, PyObject *args)
 }
 
 static PyObject *
-_nc_channels_set_foreground_rgb(PyObject *self, PyObject *args)
+_nc_channels_set_foreground_rgb(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    NcChannelsObject *nchannels_ref = NULL;
     int red = 0;
     int green = 0;
     int blue = 0;
-    if (!PyArg_ParseTuple(args, "O!iii",
-                          &NcChannelsType, &nchannels_ref,
-                          &red, &green, &blue))
+    if (nargs != 4 ||
+        !PyObject_TypeCheck(args[0], &NcChannelsType) ||
+        !fastcall_parse_int(args[1], &red) ||
+        !fastcall_parse_int(args[2], &green) ||
+        !fastcall_parse_int(args[3], &blue))
     {
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _ncchannels_set_foreground_rgb arguments");
         return NULL;
     }
-
-    if (nchannels_ref == NULL)
-    {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire NcChannelsObject");
-        return NULL;
-    }
+    NcChannelsObject *nchannels_ref = (NcChannelsObject *)args[0];
 
     int return_code = channels_set_fg_rgb8(&(nchannels_ref->ncchannels_ptr), red, green, blue);
     if (return_code != 0)
@@ -401,25 +743,88 @@ _nc_channels_set_foreground_rgb(PyObject *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+static PyObject *
+_nc_channels_get_value(PyObject *self, PyObject *args)
+{
+    NcChannelsObject *nchannels_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NcChannelsType, &nchannels_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_channels_get_value arguments");
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(nchannels_ref->ncchannels_ptr);
+}
+
 // NotcursesContext
 
+static FILE *
+nc_open_output_file(int fd)
+{
+    // Duplicated so closing the FILE does not close the caller's descriptor
+    int dup_fd = dup(fd);
+    if (dup_fd < 0)
+    {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+    FILE *output_file = fdopen(dup_fd, "w");
+    if (output_file == NULL)
+    {
+        PyErr_SetFromErrno(PyExc_OSError);
+        close(dup_fd);
+        return NULL;
+    }
+    return output_file;
+}
+
 static PyObject *
 _notcurses_context_init(PyObject *self, PyObject *args)
 {
     NotcursesContextObject *notcurses_context_ref = NULL;
-    if (!PyArg_ParseTuple(args, "O!", &NotcursesContextType, &notcurses_context_ref))
+    unsigned long long flags = 0;
+    int log_level = NCLOGLEVEL_SILENT;
+    int margin_top = 0;
+    int margin_right = 0;
+    int margin_bottom = 0;
+    int margin_left = 0;
+    int output_fd = -1;
+    if (!PyArg_ParseTuple(args, "O!Kiiiiii", &NotcursesContextType, &notcurses_context_ref,
+                          &flags, &log_level,
+                          &margin_top, &margin_right, &margin_bottom, &margin_left,
+                          &output_fd))
     {
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_init arguments");
         return NULL;
     }
-    struct notcurses *notcurses_context_ptr = notcurses_init(NULL, NULL);
+    notcurses_context_ref->options.flags = flags;
+    notcurses_context_ref->options.loglevel = (ncloglevel_e)log_level;
+    notcurses_context_ref->options.margin_t = margin_top;
+    notcurses_context_ref->options.margin_r = margin_right;
+    notcurses_context_ref->options.margin_b = margin_bottom;
+    notcurses_context_ref->options.margin_l = margin_left;
+
+    FILE *output_file = NULL;
+    if (output_fd >= 0)
+    {
+        output_file = nc_open_output_file(output_fd);
+        if (output_file == NULL)
+        {
+            return NULL;
+        }
+    }
+    struct notcurses *notcurses_context_ptr = notcurses_init(&(notcurses_context_ref->options), output_file);
     if (notcurses_context_ptr != NULL)
     {
         notcurses_context_ref->notcurses_context_ptr = notcurses_context_ptr;
+        notcurses_context_ref->output_file = output_file;
         Py_RETURN_NONE;
     }
     else
     {
+        if (output_file != NULL)
+        {
+            fclose(output_file);
+        }
         PyErr_SetString(PyExc_RuntimeError, "Failed initialize Notcurses");
         return NULL;
     }
@@ -435,6 +840,15 @@ _notcurses_context_stop(PyObject *self, PyObject *args)
         return NULL;
     }
     int return_code = notcurses_stop(notcurses_context_ref->notcurses_context_ptr);
+    notcurses_context_ref->notcurses_context_ptr = NULL;
+    // notcurses_stop already freed the queued planes
+    notcurses_context_ref->pending_destroys_num = 0;
+    ++notcurses_context_ref->generation;
+    if (notcurses_context_ref->output_file != NULL)
+    {
+        fclose(notcurses_context_ref->output_file);
+        notcurses_context_ref->output_file = NULL;
+    }
     if (return_code == 0)
     {
         Py_RETURN_NONE;
@@ -455,7 +869,11 @@ _notcurses_context_render(PyObject *self, PyObject *args)
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_render arguments");
         return NULL;
     }
-    int return_code = notcurses_render(notcurses_context_ref->notcurses_context_ptr);
+    nc_context_destroy_pending(notcurses_context_ref);
+    int return_code = 0;
+    Py_BEGIN_ALLOW_THREADS
+    return_code = notcurses_render(notcurses_context_ref->notcurses_context_ptr);
+    Py_END_ALLOW_THREADS
     if (return_code == 0)
     {
         Py_RETURN_NONE;
@@ -467,6 +885,65 @@ _notcurses_context_render(PyObject *self, PyObject *args)
     }
 }
 
+static PyObject *
+_notcurses_context_render_to_buffer(PyObject *self, PyObject *args)
+{
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NotcursesContextType, &notcurses_context_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_render_to_buffer arguments");
+        return NULL;
+    }
+    nc_context_destroy_pending(notcurses_context_ref);
+    char *buffer = NULL;
+    size_t buffer_len = 0;
+    int return_code = 0;
+    Py_BEGIN_ALLOW_THREADS
+    return_code = notcurses_render_to_buffer(notcurses_context_ref->notcurses_context_ptr, &buffer, &buffer_len);
+    Py_END_ALLOW_THREADS
+    if (return_code != 0)
+    {
+        free(buffer);
+        PyErr_SetString(PyExc_RuntimeError, "Failed to render to buffer");
+        return NULL;
+    }
+    PyObject *frame_bytes = PyBytes_FromStringAndSize(buffer != NULL ? buffer : "", (Py_ssize_t)buffer_len);
+    free(buffer);
+    return frame_bytes;
+}
+
+static PyObject *
+_notcurses_context_render_to_file(PyObject *self, PyObject *args)
+{
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    int fd = -1;
+    if (!PyArg_ParseTuple(args, "O!i", &NotcursesContextType, &notcurses_context_ref, &fd))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_render_to_file arguments");
+        return NULL;
+    }
+    FILE *output_file = nc_open_output_file(fd);
+    if (output_file == NULL)
+    {
+        return NULL;
+    }
+    nc_context_destroy_pending(notcurses_context_ref);
+    int return_code = 0;
+    Py_BEGIN_ALLOW_THREADS
+    return_code = notcurses_render_to_file(notcurses_context_ref->notcurses_context_ptr, output_file);
+    if (fclose(output_file) != 0)
+    {
+        return_code = -1;
+    }
+    Py_END_ALLOW_THREADS
+    if (return_code != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to render to file");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 static PyObject *
 _notcurses_context_mouse_disable(PyObject *self, PyObject *args)
 {
@@ -554,6 +1031,53 @@ _notcurses_context_cursor_enable(PyObject *self, PyObject *args)
     }
 }
 
+static PyObject *
+_notcurses_context_get_input_fd(PyObject *self, PyObject *args)
+{
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NotcursesContextType, &notcurses_context_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_get_input_fd arguments");
+        return NULL;
+    }
+    int input_fd = notcurses_inputready_fd(notcurses_context_ref->notcurses_context_ptr);
+    if (input_fd >= 0)
+    {
+        return PyLong_FromLong(input_fd);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to get input file descriptor");
+        return NULL;
+    }
+}
+
+static NcStatsObject *
+_notcurses_context_stats(PyObject *self, PyObject *args)
+{
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    int reset = 0;
+    if (!PyArg_ParseTuple(args, "O!p", &NotcursesContextType, &notcurses_context_ref, &reset))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_stats arguments");
+        return NULL;
+    }
+    NcStatsObject *nc_stats_ref = PyObject_NEW(NcStatsObject, &NcStatsType);
+    if (nc_stats_ref == NULL)
+    {
+        return NULL;
+    }
+    if (reset)
+    {
+        notcurses_reset_stats(notcurses_context_ref->notcurses_context_ptr, &nc_stats_ref->stats);
+    }
+    else
+    {
+        notcurses_stats(notcurses_context_ref->notcurses_context_ptr, &nc_stats_ref->stats);
+    }
+    return nc_stats_ref;
+}
+
 static NcPlaneObject *
 _notcurses_context_get_std_plane(PyObject *self, PyObject *args)
 {
@@ -570,6 +1094,10 @@ _notcurses_context_get_std_plane(PyObject *self, PyObject *args)
     if (ncplane_ref != NULL && std_plane != NULL)
     {
         ncplane_ref->ncplane_ptr = std_plane;
+        Py_INCREF(notcurses_context_ref);
+        ncplane_ref->context_ref = (PyObject *)notcurses_context_ref;
+        ncplane_ref->context_generation = notcurses_context_ref->generation;
+        ncplane_ref->is_owned = false;
         return ncplane_ref;
     }
     else
@@ -579,6 +1107,24 @@ _notcurses_context_get_std_plane(PyObject *self, PyObject *args)
     }
 }
 
+static NcInputObject *
+nc_input_object_from_ncinput(const struct ncinput *nc_input_ptr)
+{
+    NcInputObject *nc_input_ref = PyObject_NEW(NcInputObject, &NcInputType);
+    if (nc_input_ref == NULL)
+    {
+        return NULL;
+    }
+    nc_input_ref->codepoint = (long)nc_input_ptr->id;
+    nc_input_ref->y_pos = nc_input_ptr->y;
+    nc_input_ref->x_pos = nc_input_ptr->x;
+    nc_input_ref->is_alt = nc_input_ptr->alt;
+    nc_input_ref->is_shift = nc_input_ptr->shift;
+    nc_input_ref->is_ctrl = nc_input_ptr->ctrl;
+    nc_input_ref->seqnum = nc_input_ptr->seqnum;
+    return nc_input_ref;
+}
+
 static NcInputObject *
 _notcurses_context_get_input_blocking(PyObject *self, PyObject *args)
 {
@@ -589,21 +1135,13 @@ _notcurses_context_get_input_blocking(PyObject *self, PyObject *args)
         return NULL;
     }
     struct ncinput nc_input_ptr = {};
-    char32_t code_point = notcurses_getc_blocking(notcurses_context_ref->notcurses_context_ptr, &nc_input_ptr);
-    NcInputObject *nc_input_ref = PyObject_NEW(NcInputObject, &NcInputType);
-    PyObject_INIT(nc_input_ref, &NcInputType);
-    if (code_point != -1)
+    char32_t code_point = 0;
+    Py_BEGIN_ALLOW_THREADS
+    code_point = notcurses_getc_blocking(notcurses_context_ref->notcurses_context_ptr, &nc_input_ptr);
+    Py_END_ALLOW_THREADS
+    if (code_point != (char32_t)-1)
     {
-
-        nc_input_ref->codepoint = (long)nc_input_ptr.id;
-        nc_input_ref->y_pos = nc_input_ptr.y;
-        nc_input_ref->x_pos = nc_input_ptr.x;
-        nc_input_ref->is_alt = nc_input_ptr.alt;
-        nc_input_ref->is_shift = nc_input_ptr.shift;
-        nc_input_ref->is_ctrl = nc_input_ptr.ctrl;
-        nc_input_ref->seqnum = nc_input_ptr.seqnum;
-
-        return nc_input_ref;
+        return nc_input_object_from_ncinput(&nc_input_ptr);
     }
     else
     {
@@ -612,135 +1150,433 @@ _notcurses_context_get_input_blocking(PyObject *self, PyObject *args)
     }
 }
 
-// NcPlane
-
 static PyObject *
-_nc_plane_set_background_rgb(PyObject *self, PyObject *args)
+_notcurses_context_get_input_nonblocking(PyObject *self, PyObject *args)
 {
-    NcPlaneObject *nc_plane_ref = NULL;
-    int red = 0;
-    int green = 0;
-    int blue = 0;
-    if (!PyArg_ParseTuple(args, "O!iii",
-                          &NcPlaneType, &nc_plane_ref,
-                          &red, &green, &blue))
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NotcursesContextType, &notcurses_context_ref))
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_set_background_rgb arguments");
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_get_input_nonblocking arguments");
         return NULL;
     }
-
-    if (nc_plane_ref == NULL)
+    struct ncinput nc_input_ptr = {};
+    char32_t code_point = notcurses_getc_nblock(notcurses_context_ref->notcurses_context_ptr, &nc_input_ptr);
+    if (code_point == 0)
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire NcPlaneObject");
-        return NULL;
+        Py_RETURN_NONE;
     }
-
-    int return_code = ncplane_set_bg_rgb8(nc_plane_ref->ncplane_ptr, red, green, blue);
-    if (return_code != 0)
+    else if (code_point != (char32_t)-1)
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to set plane background colors");
+        return (PyObject *)nc_input_object_from_ncinput(&nc_input_ptr);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to get input");
         return NULL;
     }
-    Py_RETURN_NONE;
 }
 
 static PyObject *
-_nc_plane_set_foreground_rgb(PyObject *self, PyObject *args)
+_notcurses_context_get_input(PyObject *self, PyObject *args)
 {
-    NcPlaneObject *nc_plane_ref = NULL;
-    int red = 0;
-    int green = 0;
-    int blue = 0;
-    if (!PyArg_ParseTuple(args, "O!iii",
-                          &NcPlaneType, &nc_plane_ref,
-                          &red, &green, &blue))
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    double timeout = 0.0;
+    if (!PyArg_ParseTuple(args, "O!d", &NotcursesContextType, &notcurses_context_ref, &timeout))
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_set_foreground_rgb arguments");
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_get_input arguments");
         return NULL;
     }
-
-    if (nc_plane_ref == NULL)
+    if (timeout < 0.0)
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire NcPlaneObject");
+        PyErr_SetString(PyExc_ValueError, "Input timeout can't be negative");
         return NULL;
     }
-
-    int return_code = ncplane_set_fg_rgb8(nc_plane_ref->ncplane_ptr, red, green, blue);
-    if (return_code != 0)
+    struct timespec timeout_spec = {
+        .tv_sec = (time_t)timeout,
+        .tv_nsec = (long)((timeout - (double)(time_t)timeout) * 1e9),
+    };
+    struct ncinput nc_input_ptr = {};
+    char32_t code_point = 0;
+    Py_BEGIN_ALLOW_THREADS
+    code_point = notcurses_getc(notcurses_context_ref->notcurses_context_ptr, &timeout_spec, NULL, &nc_input_ptr);
+    Py_END_ALLOW_THREADS
+    if (code_point == 0)
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to set plane foreground colors");
+        Py_RETURN_NONE;
+    }
+    else if (code_point != (char32_t)-1)
+    {
+        return (PyObject *)nc_input_object_from_ncinput(&nc_input_ptr);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to get input");
         return NULL;
     }
-    Py_RETURN_NONE;
 }
 
+#define NCINPUT_MODIFIER_ALT 0x1
+#define NCINPUT_MODIFIER_SHIFT 0x2
+#define NCINPUT_MODIFIER_CTRL 0x4
+
 static PyObject *
-_nc_plane_putstr(PyObject *self, PyObject *args)
+_notcurses_context_drain_input(PyObject *self, PyObject *args)
 {
-    NcPlaneObject *nc_plane_ref = NULL;
-    int y_pos = -1;
-    int x_pos = -1;
-    const char *string = NULL;
-    if (!PyArg_ParseTuple(args, "O!sii",
-                          &NcPlaneType, &nc_plane_ref,
-                          &string,
-                          &y_pos, &x_pos))
+    NotcursesContextObject *notcurses_context_ref = NULL;
+    Py_ssize_t max_events = 0;
+    if (!PyArg_ParseTuple(args, "O!n", &NotcursesContextType, &notcurses_context_ref, &max_events))
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_putstr arguments");
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _notcurses_context_drain_input arguments");
         return NULL;
     }
-
-    if (nc_plane_ref == NULL)
+    if (max_events <= 0)
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire NcPlaneObject");
+        PyErr_SetString(PyExc_ValueError, "Maximum number of events must be positive");
         return NULL;
     }
 
-    int return_code = ncplane_putstr_yx(nc_plane_ref->ncplane_ptr, y_pos, x_pos, string);
-    return PyLong_FromLong(return_code);
-}
+    uint32_t *codepoints = PyMem_New(uint32_t, max_events);
+    int32_t *y_positions = PyMem_New(int32_t, max_events);
+    int32_t *x_positions = PyMem_New(int32_t, max_events);
+    uint8_t *modifiers = PyMem_New(uint8_t, max_events);
+    uint64_t *seqnums = PyMem_New(uint64_t, max_events);
+    PyObject *return_tuple = NULL;
+    if (codepoints == NULL || y_positions == NULL || x_positions == NULL ||
+        modifiers == NULL || seqnums == NULL)
+    {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
 
-static PyObject *
-_nc_plane_putstr_aligned(PyObject *self, PyObject *args)
+    Py_ssize_t events_num = 0;
+    int drain_failed = 0;
+    while (events_num < max_events)
+    {
+        struct ncinput nc_input_ptr = {};
+        char32_t code_point = notcurses_getc_nblock(notcurses_context_ref->notcurses_context_ptr, &nc_input_ptr);
+        if (code_point == 0)
+        {
+            break;
+        }
+        if (code_point == (char32_t)-1)
+        {
+            drain_failed = 1;
+            break;
+        }
+        codepoints[events_num] = (uint32_t)nc_input_ptr.id;
+        y_positions[events_num] = nc_input_ptr.y;
+        x_positions[events_num] = nc_input_ptr.x;
+        modifiers[events_num] = (nc_input_ptr.alt ? NCINPUT_MODIFIER_ALT : 0) |
+                                (nc_input_ptr.shift ? NCINPUT_MODIFIER_SHIFT : 0) |
+                                (nc_input_ptr.ctrl ? NCINPUT_MODIFIER_CTRL : 0);
+        seqnums[events_num] = nc_input_ptr.seqnum;
+        ++events_num;
+    }
+    if (drain_failed && events_num == 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to get input");
+        goto cleanup;
+    }
+
+    return_tuple = Py_BuildValue("(y#y#y#y#y#)",
+                                 (const char *)codepoints, events_num * (Py_ssize_t)sizeof(uint32_t),
+                                 (const char *)y_positions, events_num * (Py_ssize_t)sizeof(int32_t),
+                                 (const char *)x_positions, events_num * (Py_ssize_t)sizeof(int32_t),
+                                 (const char *)modifiers, events_num * (Py_ssize_t)sizeof(uint8_t),
+                                 (const char *)seqnums, events_num * (Py_ssize_t)sizeof(uint64_t));
+
+cleanup:
+    PyMem_Free(codepoints);
+    PyMem_Free(y_positions);
+    PyMem_Free(x_positions);
+    PyMem_Free(modifiers);
+    PyMem_Free(seqnums);
+    return return_tuple;
+}
+
+// NcPlane
+
+static PyObject *
+_nc_plane_set_background_rgb(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int red = 0;
+    int green = 0;
+    int blue = 0;
+    if (nargs != 4 ||
+        !PyObject_TypeCheck(args[0], &NcPlaneType) ||
+        !fastcall_parse_int(args[1], &red) ||
+        !fastcall_parse_int(args[2], &green) ||
+        !fastcall_parse_int(args[3], &blue))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_set_background_rgb arguments");
+        return NULL;
+    }
+    NcPlaneObject *nc_plane_ref = (NcPlaneObject *)args[0];
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+
+    int return_code = ncplane_set_bg_rgb8(nc_plane_ref->ncplane_ptr, red, green, blue);
+    if (return_code != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to set plane background colors");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_set_foreground_rgb(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int red = 0;
+    int green = 0;
+    int blue = 0;
+    if (nargs != 4 ||
+        !PyObject_TypeCheck(args[0], &NcPlaneType) ||
+        !fastcall_parse_int(args[1], &red) ||
+        !fastcall_parse_int(args[2], &green) ||
+        !fastcall_parse_int(args[3], &blue))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_set_foreground_rgb arguments");
+        return NULL;
+    }
+    NcPlaneObject *nc_plane_ref = (NcPlaneObject *)args[0];
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+
+    int return_code = ncplane_set_fg_rgb8(nc_plane_ref->ncplane_ptr, red, green, blue);
+    if (return_code != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to set plane foreground colors");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_putstr(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    NcPlaneObject *nc_plane_ref = NULL;
     int y_pos = -1;
-    ncalign_e align = NCALIGN_UNALIGNED;
+    int x_pos = -1;
     const char *string = NULL;
-    if (!PyArg_ParseTuple(args, "O!sii",
-                          &NcPlaneType, &nc_plane_ref,
-                          &string,
-                          &y_pos, &align))
+    if (nargs < 4 || nargs > 5 ||
+        !PyObject_TypeCheck(args[0], &NcPlaneType) ||
+        (string = PyUnicode_AsUTF8(args[1])) == NULL ||
+        !fastcall_parse_int(args[2], &y_pos) ||
+        !fastcall_parse_int(args[3], &x_pos) ||
+        (nargs == 5 && args[4] != Py_None && !PyObject_TypeCheck(args[4], &NcChannelsType)))
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_putstr_aligned arguments");
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_putstr arguments");
         return NULL;
     }
+    NcPlaneObject *nc_plane_ref = (NcPlaneObject *)args[0];
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+
+    if (nargs == 5 && args[4] != Py_None)
+    {
+        struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+        uint64_t saved_channels = ncplane_channels(plane);
+        ncplane_set_channels(plane, ((NcChannelsObject *)args[4])->ncchannels_ptr);
+        int return_code = ncplane_putstr_yx(plane, y_pos, x_pos, string);
+        ncplane_set_channels(plane, saved_channels);
+        return PyLong_FromLong(return_code);
+    }
 
-    int return_code = ncplane_putstr_aligned(nc_plane_ref->ncplane_ptr, y_pos, align, string);
+    int return_code = ncplane_putstr_yx(nc_plane_ref->ncplane_ptr, y_pos, x_pos, string);
     return PyLong_FromLong(return_code);
 }
 
 static PyObject *
-_nc_plane_dimensions_yx(PyObject *self, PyObject *args)
+_nc_plane_put_runs(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    PyObject *runs_object = NULL;
+    int y_pos = -1;
+    int x_pos = -1;
+    if (!PyArg_ParseTuple(args, "O!Oii",
+                          &NcPlaneType, &nc_plane_ref,
+                          &runs_object,
+                          &y_pos, &x_pos))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_put_runs arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    PyObject *runs_fast = PySequence_Fast(runs_object, "Runs must be a sequence");
+    if (runs_fast == NULL)
+    {
+        return NULL;
+    }
+    Py_ssize_t runs_num = PySequence_Fast_GET_SIZE(runs_fast);
+    PyObject **runs = PySequence_Fast_ITEMS(runs_fast);
+
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+    uint64_t saved_channels = ncplane_channels(plane);
+    long cols_written = 0;
+    int parse_failed = 0;
+    for (Py_ssize_t i = 0; i < runs_num; ++i)
+    {
+        const char *string = NULL;
+        PyObject *channels_object = NULL;
+        if (!PyArg_ParseTuple(runs[i], "sO", &string, &channels_object) ||
+            (channels_object != Py_None && !PyObject_TypeCheck(channels_object, &NcChannelsType)))
+        {
+            parse_failed = 1;
+            break;
+        }
+        ncplane_set_channels(plane, channels_object != Py_None ? ((NcChannelsObject *)channels_object)->ncchannels_ptr : saved_channels);
+        int return_code = i == 0 ? ncplane_putstr_yx(plane, y_pos, x_pos, string) : ncplane_putstr(plane, string);
+        if (return_code < 0)
+        {
+            cols_written = -(cols_written - return_code);
+            break;
+        }
+        cols_written += return_code;
+    }
+    ncplane_set_channels(plane, saved_channels);
+    Py_DECREF(runs_fast);
+
+    if (parse_failed)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_put_runs run");
+        return NULL;
+    }
+    return PyLong_FromLong(cols_written);
+}
+
+static PyObject *
+_nc_plane_put_lines(PyObject *self, PyObject *args)
 {
     NcPlaneObject *nc_plane_ref = NULL;
+    PyObject *lines_object = NULL;
+    int y_pos = 0;
+    int wrap_lines = 0;
+    if (!PyArg_ParseTuple(args, "O!Oip",
+                          &NcPlaneType, &nc_plane_ref,
+                          &lines_object,
+                          &y_pos, &wrap_lines))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_put_lines arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    PyObject *lines_iter = PyObject_GetIter(lines_object);
+    if (lines_iter == NULL)
+    {
+        return NULL;
+    }
+
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
     int y_dim = 0;
     int x_dim = 0;
-    if (!PyArg_ParseTuple(args, "O!",
-                          &NcPlaneType, &nc_plane_ref))
+    ncplane_dim_yx(plane, &y_dim, &x_dim);
+    long lines_consumed = 0;
+    // Stop pulling lines once the plane is full
+    while (y_pos < y_dim)
+    {
+        PyObject *line = PyIter_Next(lines_iter);
+        if (line == NULL)
+        {
+            break;
+        }
+        const char *string = PyUnicode_AsUTF8(line);
+        if (string == NULL)
+        {
+            Py_DECREF(line);
+            break;
+        }
+        ++lines_consumed;
+
+        int x_pos = 0;
+        while (*string != '\0')
+        {
+            size_t egc_bytes = 0;
+            int egc_cols = ncplane_putegc_yx(plane, y_pos, x_pos, string, &egc_bytes);
+            if (egc_cols < 0)
+            {
+                // Grapheme does not fit in the rest of the row
+                if (!wrap_lines || x_pos == 0 || y_pos + 1 >= y_dim)
+                {
+                    break;
+                }
+                ++y_pos;
+                x_pos = 0;
+                continue;
+            }
+            if (egc_bytes == 0)
+            {
+                break;
+            }
+            string += egc_bytes;
+            x_pos += egc_cols;
+        }
+        Py_DECREF(line);
+        ++y_pos;
+    }
+    Py_DECREF(lines_iter);
+
+    if (PyErr_Occurred())
+    {
+        return NULL;
+    }
+    return PyLong_FromLong(lines_consumed);
+}
+
+static PyObject *
+_nc_plane_putstr_aligned(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int y_pos = -1;
+    int align = NCALIGN_UNALIGNED;
+    const char *string = NULL;
+    if (nargs != 4 ||
+        !PyObject_TypeCheck(args[0], &NcPlaneType) ||
+        (string = PyUnicode_AsUTF8(args[1])) == NULL ||
+        !fastcall_parse_int(args[2], &y_pos) ||
+        !fastcall_parse_int(args[3], &align))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_putstr_aligned arguments");
+        return NULL;
+    }
+    NcPlaneObject *nc_plane_ref = (NcPlaneObject *)args[0];
+    if (!nc_plane_check_alive(nc_plane_ref))
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_set_foreground_rgb arguments");
         return NULL;
     }
 
-    if (nc_plane_ref == NULL)
+    int return_code = ncplane_putstr_aligned(nc_plane_ref->ncplane_ptr, y_pos, (ncalign_e)align, string);
+    return PyLong_FromLong(return_code);
+}
+
+static PyObject *
+_nc_plane_dimensions_yx(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int y_dim = 0;
+    int x_dim = 0;
+    if (nargs != 1 || !PyObject_TypeCheck(args[0], &NcPlaneType))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_dimensions_yx arguments");
+        return NULL;
+    }
+    NcPlaneObject *nc_plane_ref = (NcPlaneObject *)args[0];
+    if (!nc_plane_check_alive(nc_plane_ref))
     {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire NcPlaneObject");
         return NULL;
     }
 
     ncplane_dim_yx(nc_plane_ref->ncplane_ptr, &y_dim, &x_dim);
-    return PyTuple_Pack(2, PyLong_FromLong(y_dim), PyLong_FromLong(x_dim));
+    return Py_BuildValue("(ii)", y_dim, x_dim);
 }
 
 static PyObject *
@@ -758,6 +1594,10 @@ _nc_plane_polyfill_yx(PyObject *self, PyObject *args)
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_polyfill_yx arguments");
         return NULL;
     }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
     cell cell_to_fill_with = CELL_CHAR_INITIALIZER(*cell_str);
     int return_code = ncplane_polyfill_yx(nc_plane_ref->ncplane_ptr, y_dim, x_dim, &cell_to_fill_with);
     if (return_code != -1)
@@ -780,10 +1620,202 @@ _nc_plane_erase(PyObject *self, PyObject *args)
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_erase arguments");
         return NULL;
     }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
     ncplane_erase(nc_plane_ref->ncplane_ptr);
     Py_RETURN_NONE;
 }
 
+static PyObject *
+_nc_plane_move_yx(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    int y_pos = 0;
+    int x_pos = 0;
+    if (!PyArg_ParseTuple(args, "O!ii", &NcPlaneType, &nc_plane_ref, &y_pos, &x_pos))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_move_yx arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    if (ncplane_move_yx(nc_plane_ref->ncplane_ptr, y_pos, x_pos) != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to move NcPlane");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_resize_simple(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    int rows_num = 0;
+    int cols_num = 0;
+    if (!PyArg_ParseTuple(args, "O!ii", &NcPlaneType, &nc_plane_ref, &rows_num, &cols_num))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_resize_simple arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    if (ncplane_resize_simple(nc_plane_ref->ncplane_ptr, rows_num, cols_num) != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to resize NcPlane");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_yx(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NcPlaneType, &nc_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_yx arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    int y_pos = 0;
+    int x_pos = 0;
+    ncplane_yx(nc_plane_ref->ncplane_ptr, &y_pos, &x_pos);
+    return Py_BuildValue("(ii)", y_pos, x_pos);
+}
+
+static PyObject *
+_nc_plane_reparent(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    NcPlaneObject *new_parent_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!O!", &NcPlaneType, &nc_plane_ref, &NcPlaneType, &new_parent_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_reparent arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref) || !nc_plane_check_alive(new_parent_ref))
+    {
+        return NULL;
+    }
+    if (!nc_plane_ref->is_owned)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Standard plane can not be reparented");
+        return NULL;
+    }
+    if (ncplane_reparent(nc_plane_ref->ncplane_ptr, new_parent_ref->ncplane_ptr) == NULL)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to reparent NcPlane");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_move_top(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NcPlaneType, &nc_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_move_top arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    ncplane_move_top(nc_plane_ref->ncplane_ptr);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_move_bottom(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NcPlaneType, &nc_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_move_bottom arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    ncplane_move_bottom(nc_plane_ref->ncplane_ptr);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_move_above(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    NcPlaneObject *other_plane_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!O!", &NcPlaneType, &nc_plane_ref, &NcPlaneType, &other_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_move_above arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref) || !nc_plane_check_alive(other_plane_ref))
+    {
+        return NULL;
+    }
+    if (ncplane_move_above(nc_plane_ref->ncplane_ptr, other_plane_ref->ncplane_ptr) != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to move NcPlane above other plane");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_move_below(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    NcPlaneObject *other_plane_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!O!", &NcPlaneType, &nc_plane_ref, &NcPlaneType, &other_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_move_below arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref) || !nc_plane_check_alive(other_plane_ref))
+    {
+        return NULL;
+    }
+    if (ncplane_move_below(nc_plane_ref->ncplane_ptr, other_plane_ref->ncplane_ptr) != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to move NcPlane below other plane");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_set_scrolling(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    int scrolling = 0;
+    if (!PyArg_ParseTuple(args, "O!p", &NcPlaneType, &nc_plane_ref, &scrolling))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_set_scrolling arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    bool was_scrolling = ncplane_set_scrolling(nc_plane_ref->ncplane_ptr, scrolling);
+    return PyBool_FromLong(was_scrolling);
+}
+
 static NcPlaneObject *
 _nc_plane_create(PyObject *self, PyObject *args)
 {
@@ -797,6 +1829,10 @@ _nc_plane_create(PyObject *self, PyObject *args)
         PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_create arguments");
         return NULL;
     }
+    if (!nc_plane_check_alive(nc_plane_parent))
+    {
+        return NULL;
+    }
     ncplane_options create_options = {
         .y = y_pos,
         .horiz.x = x_pos,
@@ -807,8 +1843,17 @@ _nc_plane_create(PyObject *self, PyObject *args)
     if (new_nc_plane != NULL)
     {
         NcPlaneObject *ncplane_ref = PyObject_NEW(NcPlaneObject, &NcPlaneType);
+        if (ncplane_ref == NULL)
+        {
+            ncplane_destroy(new_nc_plane);
+            return NULL;
+        }
 
         ncplane_ref->ncplane_ptr = new_nc_plane;
+        Py_XINCREF(nc_plane_parent->context_ref);
+        ncplane_ref->context_ref = nc_plane_parent->context_ref;
+        ncplane_ref->context_generation = nc_plane_parent->context_generation;
+        ncplane_ref->is_owned = true;
         return ncplane_ref;
     }
     else
@@ -818,6 +1863,702 @@ _nc_plane_create(PyObject *self, PyObject *args)
     }
 }
 
+static PyObject *
+_nc_plane_destroy(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    if (!PyArg_ParseTuple(args, "O!", &NcPlaneType, &nc_plane_ref))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_destroy arguments");
+        return NULL;
+    }
+    if (!nc_plane_ref->is_owned)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Standard plane can not be destroyed");
+        return NULL;
+    }
+    if (nc_plane_ref->ncplane_ptr == NULL || !nc_plane_context_is_running(nc_plane_ref))
+    {
+        nc_plane_ref->ncplane_ptr = NULL;
+        Py_RETURN_NONE;
+    }
+    nc_context_destroy_pending((NotcursesContextObject *)nc_plane_ref->context_ref);
+    int return_code = ncplane_destroy(nc_plane_ref->ncplane_ptr);
+    nc_plane_ref->ncplane_ptr = NULL;
+    if (return_code != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to destroy NcPlane");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static bool
+nc_cells_buffer_format_is_valid(const char *format)
+{
+    // NULL format means unsigned bytes
+    if (format == NULL)
+    {
+        return false;
+    }
+    // Only native byte order can be read as uint32_t
+    if (*format == '@' || *format == '=' || *format == (PY_LITTLE_ENDIAN ? '<' : '>'))
+    {
+        ++format;
+    }
+    return format[0] != '\0' && format[1] == '\0' && strchr("IiLl", format[0]) != NULL;
+}
+
+static int
+nc_plane_get_cells_buffer(PyObject *obj, Py_buffer *view, Py_ssize_t cells_num, bool is_writable)
+{
+    int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+    if (is_writable)
+    {
+        flags |= PyBUF_WRITABLE;
+    }
+    if (PyObject_GetBuffer(obj, view, flags) != 0)
+    {
+        return -1;
+    }
+    if (view->itemsize != sizeof(uint32_t) || !nc_cells_buffer_format_is_valid(view->format))
+    {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_ValueError, "Cells buffer must contain 32-bit integers");
+        return -1;
+    }
+    if (view->len < cells_num * (Py_ssize_t)sizeof(uint32_t))
+    {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_ValueError, "Cells buffer must contain enough 32-bit items");
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+_nc_plane_blit_cells(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    PyObject *chars_object = NULL;
+    PyObject *foreground_object = NULL;
+    PyObject *background_object = NULL;
+    int y_pos = 0;
+    int x_pos = 0;
+    int cols_num = 0;
+    if (!PyArg_ParseTuple(args, "O!OOOiii",
+                          &NcPlaneType, &nc_plane_ref,
+                          &chars_object, &foreground_object, &background_object,
+                          &y_pos, &x_pos, &cols_num))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_blit_cells arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    if (cols_num <= 0 || y_pos < 0 || x_pos < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Invalid _nc_plane_blit_cells region");
+        return NULL;
+    }
+
+    Py_buffer chars_view = {0};
+    Py_buffer foreground_view = {0};
+    Py_buffer background_view = {0};
+    if (PyObject_GetBuffer(chars_object, &chars_view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0)
+    {
+        return NULL;
+    }
+    if (chars_view.itemsize != sizeof(uint32_t))
+    {
+        PyBuffer_Release(&chars_view);
+        PyErr_SetString(PyExc_ValueError, "Chars buffer must contain 32-bit codepoints");
+        return NULL;
+    }
+    Py_ssize_t cells_num = chars_view.len / (Py_ssize_t)sizeof(uint32_t);
+    const uint32_t *foreground = NULL;
+    const uint32_t *background = NULL;
+    if (foreground_object != Py_None)
+    {
+        if (nc_plane_get_cells_buffer(foreground_object, &foreground_view, cells_num, false) != 0)
+        {
+            PyBuffer_Release(&chars_view);
+            return NULL;
+        }
+        foreground = foreground_view.buf;
+    }
+    if (background_object != Py_None)
+    {
+        if (nc_plane_get_cells_buffer(background_object, &background_view, cells_num, false) != 0)
+        {
+            PyBuffer_Release(&chars_view);
+            if (foreground != NULL)
+            {
+                PyBuffer_Release(&foreground_view);
+            }
+            return NULL;
+        }
+        background = background_view.buf;
+    }
+
+    const uint32_t *chars = chars_view.buf;
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+    long cells_written = 0;
+    Py_BEGIN_ALLOW_THREADS
+    int y_dim = 0;
+    int x_dim = 0;
+    ncplane_dim_yx(plane, &y_dim, &x_dim);
+    Py_ssize_t rows_num = (cells_num + cols_num - 1) / cols_num;
+    Py_ssize_t rows_visible = y_dim - y_pos < rows_num ? y_dim - y_pos : rows_num;
+    int cols_visible = x_dim - x_pos < cols_num ? x_dim - x_pos : cols_num;
+    uint64_t saved_channels = ncplane_channels(plane);
+    for (Py_ssize_t row = 0; row < rows_visible; ++row)
+    {
+        for (int col = 0; col < cols_visible; ++col)
+        {
+            Py_ssize_t index = row * cols_num + col;
+            if (index >= cells_num)
+            {
+                break;
+            }
+            if (foreground != NULL)
+            {
+                ncplane_set_fg_rgb(plane, foreground[index] & 0xffffffu);
+            }
+            if (background != NULL)
+            {
+                ncplane_set_bg_rgb(plane, background[index] & 0xffffffu);
+            }
+            wchar_t codepoint = chars[index] != 0 ? (wchar_t)chars[index] : L' ';
+            int return_code = ncplane_putwc_yx(plane, y_pos + (int)row, x_pos + col, codepoint);
+            if (return_code > 0)
+            {
+                ++cells_written;
+                // A wide glyph covers the following cells, writing them would overwrite it
+                col += return_code - 1;
+            }
+        }
+    }
+    ncplane_set_channels(plane, saved_channels);
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&chars_view);
+    if (foreground != NULL)
+    {
+        PyBuffer_Release(&foreground_view);
+    }
+    if (background != NULL)
+    {
+        PyBuffer_Release(&background_view);
+    }
+    return PyLong_FromLong(cells_written);
+}
+
+static PyObject *
+_nc_plane_blit_cells_diff(PyObject *self, PyObject *args)
+{
+    // Buffers are: chars, foreground, background and their previous frame
+    NcPlaneObject *nc_plane_ref = NULL;
+    PyObject *buffer_objects[6] = {NULL};
+    int y_pos = 0;
+    int x_pos = 0;
+    int rows_num = 0;
+    int cols_num = 0;
+    if (!PyArg_ParseTuple(args, "O!OOOOOOiiii",
+                          &NcPlaneType, &nc_plane_ref,
+                          &buffer_objects[0], &buffer_objects[1], &buffer_objects[2],
+                          &buffer_objects[3], &buffer_objects[4], &buffer_objects[5],
+                          &y_pos, &x_pos, &rows_num, &cols_num))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_blit_cells_diff arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    if (rows_num <= 0 || cols_num <= 0 || y_pos < 0 || x_pos < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Invalid _nc_plane_blit_cells_diff region");
+        return NULL;
+    }
+    for (int i = 0; i < 3; ++i)
+    {
+        if ((buffer_objects[i] == Py_None) != (buffer_objects[i + 3] == Py_None) ||
+            (i == 0 && buffer_objects[i] == Py_None))
+        {
+            PyErr_SetString(PyExc_ValueError, "Every frame buffer needs a previous frame buffer");
+            return NULL;
+        }
+    }
+
+    Py_ssize_t cells_num = (Py_ssize_t)rows_num * cols_num;
+    Py_buffer views[6];
+    uint32_t *buffers[6] = {NULL};
+    int views_num = 0;
+    for (; views_num < 6; ++views_num)
+    {
+        if (buffer_objects[views_num] == Py_None)
+        {
+            continue;
+        }
+        if (nc_plane_get_cells_buffer(buffer_objects[views_num], &views[views_num],
+                                      cells_num, views_num >= 3) != 0)
+        {
+            break;
+        }
+        buffers[views_num] = views[views_num].buf;
+    }
+    if (views_num < 6)
+    {
+        for (int i = 0; i < views_num; ++i)
+        {
+            if (buffers[i] != NULL)
+            {
+                PyBuffer_Release(&views[i]);
+            }
+        }
+        return NULL;
+    }
+
+    const uint32_t *chars = buffers[0];
+    const uint32_t *foreground = buffers[1];
+    const uint32_t *background = buffers[2];
+    uint32_t *prev_chars = buffers[3];
+    uint32_t *prev_foreground = buffers[4];
+    uint32_t *prev_background = buffers[5];
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+    long cells_written = 0;
+    Py_BEGIN_ALLOW_THREADS
+    int y_dim = 0;
+    int x_dim = 0;
+    ncplane_dim_yx(plane, &y_dim, &x_dim);
+    int rows_visible = y_dim - y_pos < rows_num ? y_dim - y_pos : rows_num;
+    int cols_visible = x_dim - x_pos < cols_num ? x_dim - x_pos : cols_num;
+    uint64_t saved_channels = ncplane_channels(plane);
+    for (int row = 0; row < rows_visible; ++row)
+    {
+        // Cells following a written cell continue from the cursor
+        bool is_in_run = false;
+        for (int col = 0; col < cols_visible; ++col)
+        {
+            Py_ssize_t index = (Py_ssize_t)row * cols_num + col;
+            if (chars[index] == prev_chars[index] &&
+                (foreground == NULL || foreground[index] == prev_foreground[index]) &&
+                (background == NULL || background[index] == prev_background[index]))
+            {
+                is_in_run = false;
+                continue;
+            }
+            if (foreground != NULL)
+            {
+                ncplane_set_fg_rgb(plane, foreground[index] & 0xffffffu);
+            }
+            if (background != NULL)
+            {
+                ncplane_set_bg_rgb(plane, background[index] & 0xffffffu);
+            }
+            wchar_t codepoint = chars[index] != 0 ? (wchar_t)chars[index] : L' ';
+            int return_code = is_in_run
+                                  ? ncplane_putwc(plane, codepoint)
+                                  : ncplane_putwc_yx(plane, y_pos + row, x_pos + col, codepoint);
+            // A wide glyph moves the cursor past the next cell, so the run ends there
+            is_in_run = return_code == 1;
+            if (return_code <= 0)
+            {
+                // Previous frame keeps the old cell so it is written again next time
+                continue;
+            }
+            prev_chars[index] = chars[index];
+            if (foreground != NULL)
+            {
+                prev_foreground[index] = foreground[index];
+            }
+            if (background != NULL)
+            {
+                prev_background[index] = background[index];
+            }
+            ++cells_written;
+        }
+    }
+    ncplane_set_channels(plane, saved_channels);
+    Py_END_ALLOW_THREADS
+
+    for (int i = 0; i < 6; ++i)
+    {
+        if (buffers[i] != NULL)
+        {
+            PyBuffer_Release(&views[i]);
+        }
+    }
+    return PyLong_FromLong(cells_written);
+}
+
+static uint32_t
+nc_utf8_first_codepoint(const char *egc)
+{
+    const unsigned char *bytes = (const unsigned char *)egc;
+    if (bytes[0] < 0x80)
+    {
+        return bytes[0];
+    }
+    int continuation_num = 0;
+    uint32_t codepoint = 0;
+    if ((bytes[0] & 0xe0) == 0xc0)
+    {
+        continuation_num = 1;
+        codepoint = bytes[0] & 0x1f;
+    }
+    else if ((bytes[0] & 0xf0) == 0xe0)
+    {
+        continuation_num = 2;
+        codepoint = bytes[0] & 0x0f;
+    }
+    else if ((bytes[0] & 0xf8) == 0xf0)
+    {
+        continuation_num = 3;
+        codepoint = bytes[0] & 0x07;
+    }
+    else
+    {
+        return 0xfffd;
+    }
+    for (int i = 1; i <= continuation_num; ++i)
+    {
+        if ((bytes[i] & 0xc0) != 0x80)
+        {
+            return 0xfffd;
+        }
+        codepoint = (codepoint << 6) | (bytes[i] & 0x3f);
+    }
+    return codepoint;
+}
+
+static PyObject *
+_nc_plane_snapshot(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    int y_pos = 0;
+    int x_pos = 0;
+    int rows_num = 0;
+    int cols_num = 0;
+    if (!PyArg_ParseTuple(args, "O!iiii",
+                          &NcPlaneType, &nc_plane_ref,
+                          &y_pos, &x_pos, &rows_num, &cols_num))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_snapshot arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    if (rows_num < 0 || cols_num < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Invalid _nc_plane_snapshot region");
+        return NULL;
+    }
+
+    Py_ssize_t cells_num = (Py_ssize_t)rows_num * cols_num;
+    PyObject *glyphs_bytes = PyBytes_FromStringAndSize(NULL, cells_num * (Py_ssize_t)sizeof(uint32_t));
+    PyObject *channels_bytes = PyBytes_FromStringAndSize(NULL, cells_num * (Py_ssize_t)sizeof(uint64_t));
+    if (glyphs_bytes == NULL || channels_bytes == NULL)
+    {
+        Py_XDECREF(glyphs_bytes);
+        Py_XDECREF(channels_bytes);
+        return NULL;
+    }
+    uint32_t *glyphs = (uint32_t *)PyBytes_AS_STRING(glyphs_bytes);
+    uint64_t *channels = (uint64_t *)PyBytes_AS_STRING(channels_bytes);
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+
+    Py_BEGIN_ALLOW_THREADS
+    int y_dim = 0;
+    int x_dim = 0;
+    ncplane_dim_yx(plane, &y_dim, &x_dim);
+    for (int row = 0; row < rows_num; ++row)
+    {
+        for (int col = 0; col < cols_num; ++col)
+        {
+            Py_ssize_t index = (Py_ssize_t)row * cols_num + col;
+            int y = y_pos + row;
+            int x = x_pos + col;
+            glyphs[index] = 0;
+            channels[index] = 0;
+            if (y < 0 || x < 0 || y >= y_dim || x >= x_dim)
+            {
+                continue;
+            }
+            uint16_t stylemask = 0;
+            char *egc = ncplane_at_yx(plane, y, x, &stylemask, &channels[index]);
+            if (egc != NULL)
+            {
+                glyphs[index] = nc_utf8_first_codepoint(egc);
+                free(egc);
+            }
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    return Py_BuildValue("(NN)", glyphs_bytes, channels_bytes);
+}
+
+static PyObject *
+_nc_plane_blit_rgba(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    PyObject *buffer_object = NULL;
+    int rows_num = 0;
+    int cols_num = 0;
+    int row_stride = 0;
+    int scale = NCSCALE_NONE;
+    int y_pos = 0;
+    int x_pos = 0;
+    if (!PyArg_ParseTuple(args, "O!Oiiiiii",
+                          &NcPlaneType, &nc_plane_ref,
+                          &buffer_object,
+                          &rows_num, &cols_num, &row_stride,
+                          &scale, &y_pos, &x_pos))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_blit_rgba arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+    if (rows_num <= 0 || cols_num <= 0 || row_stride < cols_num * 4)
+    {
+        PyErr_SetString(PyExc_ValueError, "Invalid RGBA image geometry");
+        return NULL;
+    }
+
+    Py_buffer rgba_view = {0};
+    if (PyObject_GetBuffer(buffer_object, &rgba_view, PyBUF_SIMPLE) != 0)
+    {
+        return NULL;
+    }
+    if (rgba_view.len < (Py_ssize_t)(rows_num - 1) * row_stride + (Py_ssize_t)cols_num * 4)
+    {
+        PyBuffer_Release(&rgba_view);
+        PyErr_SetString(PyExc_ValueError, "RGBA buffer is smaller than the image geometry");
+        return NULL;
+    }
+
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+    int return_code = -1;
+    Py_BEGIN_ALLOW_THREADS
+    struct ncvisual *visual = ncvisual_from_rgba(rgba_view.buf, rows_num, row_stride, cols_num);
+    if (visual != NULL)
+    {
+        struct ncvisual_options visual_options = {
+            .n = plane,
+            .scaling = (ncscale_e)scale,
+            .y = y_pos,
+            .x = x_pos,
+        };
+        if (ncvisual_render(ncplane_notcurses(plane), visual, &visual_options) != NULL)
+        {
+            return_code = 0;
+        }
+        ncvisual_destroy(visual);
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&rgba_view);
+    if (return_code != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to blit RGBA image");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_nc_plane_hbar(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    int y_pos = 0;
+    int x_pos = 0;
+    double value = 0.0;
+    int width = 0;
+    int from_rgb[3] = {0};
+    int to_rgb[3] = {0};
+    const char *fill = NULL;
+    if (!PyArg_ParseTuple(args, "O!iidi(iii)(iii)s",
+                          &NcPlaneType, &nc_plane_ref,
+                          &y_pos, &x_pos,
+                          &value, &width,
+                          &from_rgb[0], &from_rgb[1], &from_rgb[2],
+                          &to_rgb[0], &to_rgb[1], &to_rgb[2],
+                          &fill))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_hbar arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+    int blocks_num = nc_bar_blocks_num(value, width);
+    int blocks_written = 0;
+    uint64_t saved_channels = ncplane_channels(plane);
+    for (int i = 0; i < blocks_num; ++i)
+    {
+        unsigned block_rgb = nc_rgb_interpolate(from_rgb, to_rgb, i, width - 1);
+        ncplane_set_fg_rgb(plane, block_rgb);
+        ncplane_set_bg_rgb(plane, block_rgb);
+        int return_code = i == 0 ? ncplane_putegc_yx(plane, y_pos, x_pos, fill, NULL) : ncplane_putegc(plane, fill, NULL);
+        if (return_code < 0)
+        {
+            break;
+        }
+        ++blocks_written;
+    }
+    ncplane_set_channels(plane, saved_channels);
+    return PyLong_FromLong(blocks_written);
+}
+
+static PyObject *
+_nc_plane_gradient(PyObject *self, PyObject *args)
+{
+    NcPlaneObject *nc_plane_ref = NULL;
+    const char *fill = NULL;
+    int corners_rgb[4][3] = {{0}};
+    int y_pos = 0;
+    int x_pos = 0;
+    int y_stop = 0;
+    int x_stop = 0;
+    if (!PyArg_ParseTuple(args, "O!s(iii)(iii)(iii)(iii)iiii",
+                          &NcPlaneType, &nc_plane_ref,
+                          &fill,
+                          &corners_rgb[0][0], &corners_rgb[0][1], &corners_rgb[0][2],
+                          &corners_rgb[1][0], &corners_rgb[1][1], &corners_rgb[1][2],
+                          &corners_rgb[2][0], &corners_rgb[2][1], &corners_rgb[2][2],
+                          &corners_rgb[3][0], &corners_rgb[3][1], &corners_rgb[3][2],
+                          &y_pos, &x_pos, &y_stop, &x_stop))
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to parse _nc_plane_gradient arguments");
+        return NULL;
+    }
+    if (!nc_plane_check_alive(nc_plane_ref))
+    {
+        return NULL;
+    }
+
+    uint64_t corners_channels[4] = {0};
+    for (int i = 0; i < 4; ++i)
+    {
+        if (channels_set_fg_rgb8(&corners_channels[i], corners_rgb[i][0], corners_rgb[i][1], corners_rgb[i][2]) != 0 ||
+            channels_set_bg_rgb8(&corners_channels[i], corners_rgb[i][0], corners_rgb[i][1], corners_rgb[i][2]) != 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "Invalid gradient color");
+            return NULL;
+        }
+    }
+
+    struct ncplane *plane = nc_plane_ref->ncplane_ptr;
+    if (ncplane_cursor_move_yx(plane, y_pos, x_pos) != 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Gradient start is outside of plane");
+        return NULL;
+    }
+    int return_code = ncplane_gradient(plane, fill, 0,
+                                       corners_channels[0], corners_channels[1],
+                                       corners_channels[2], corners_channels[3],
+                                       y_stop, x_stop);
+    if (return_code < 0)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "Failed to fill gradient");
+        return NULL;
+    }
+    return PyLong_FromLong(return_code);
+}
+
+// Members of NcInputCodes enum
+typedef struct
+{
+    const char *name;
+    long value;
+} NcInputCodeEntry;
+
+static const NcInputCodeEntry nc_input_codes[] = {
+    {"INVALID", NCKEY_INVALID},
+    {"UP", NCKEY_UP},
+    {"RESIZE", NCKEY_RESIZE},
+    {"RIGHT", NCKEY_RIGHT},
+    {"DOWN", NCKEY_DOWN},
+    {"LEFT", NCKEY_LEFT},
+    {"INSERT", NCKEY_INS},
+    {"DELETE", NCKEY_DEL},
+    {"BACKSPACE", NCKEY_BACKSPACE},
+    {"PAGE_DOWN", NCKEY_PGDOWN},
+    {"PAGE_UP", NCKEY_PGUP},
+    {"HOME", NCKEY_HOME},
+    {"EBD", NCKEY_END},
+    {"F0", NCKEY_F00},
+    {"F1", NCKEY_F01},
+    {"F2", NCKEY_F02},
+    {"F3", NCKEY_F03},
+    {"F4", NCKEY_F04},
+    {"F5", NCKEY_F05},
+    {"F6", NCKEY_F06},
+    {"F7", NCKEY_F07},
+    {"F8", NCKEY_F08},
+    {"F9", NCKEY_F09},
+    {"F10", NCKEY_F10},
+    {"F11", NCKEY_F11},
+    {"F12", NCKEY_F12},
+    {"ENTER", NCKEY_ENTER},
+    {"CAPS_LOCL", NCKEY_CLS},
+    {"DOWN_LEFT", NCKEY_DLEFT},
+    {"DOWN_RIGHT", NCKEY_DRIGHT},
+    {"UP_LEFT", NCKEY_ULEFT},
+    {"UP_RIGHT", NCKEY_URIGHT},
+    {"CENTER", NCKEY_CENTER},
+    {"BEGIN", NCKEY_BEGIN},
+    {"CANCEL", NCKEY_CANCEL},
+    {"CLOSE", NCKEY_CLOSE},
+    {"COMMAND", NCKEY_COMMAND},
+    {"COPY", NCKEY_COPY},
+    {"EXIT", NCKEY_EXIT},
+    {"PRINT", NCKEY_PRINT},
+    {"REFRESH", NCKEY_REFRESH},
+    {"MOUSE_LEFT_BUTTON", NCKEY_BUTTON1},
+    {"MOUSE_MIDDLE_BUTTON", NCKEY_BUTTON2},
+    {"MOUSE_RIGHT_BUTTON", NCKEY_BUTTON3},
+    {"MOUSE_SCROLL_UP", NCKEY_SCROLL_UP},
+    {"MOUSE_SCROLL_DOWN", NCKEY_SCROLL_DOWN},
+    {"MOUSE_6", NCKEY_BUTTON6},
+    {"MOUSE_RELEASE", NCKEY_RELEASE},
+};
+
+static PyObject *
+_nc_input_codes(PyObject *self, PyObject *args)
+{
+    Py_ssize_t codes_num = sizeof(nc_input_codes) / sizeof(nc_input_codes[0]);
+    PyObject *codes_tuple = PyTuple_New(codes_num);
+    if (codes_tuple == NULL)
+    {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < codes_num; ++i)
+    {
+        PyObject *code_pair = Py_BuildValue("(sl)", nc_input_codes[i].name, nc_input_codes[i].value);
+        if (code_pair == NULL)
+        {
+            Py_DECREF(codes_tuple);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(codes_tuple, i, code_pair);
+    }
+    return codes_tuple;
+}
+
 static PyObject *
 get_notcurses_version_str(PyObject *self, PyObject *args)
 {
@@ -831,29 +2572,58 @@ static PyMethodDef NotcursesMethods[] = {
     {"_nc_direct_init", (PyCFunction)_nc_direct_init, METH_VARARGS, NULL},
     {"_nc_direct_stop", (PyCFunction)_nc_direct_stop, METH_VARARGS, NULL},
     {"_nc_direct_putstr", (PyCFunction)_nc_direct_putstr, METH_VARARGS, NULL},
+    {"_nc_direct_putstr_many", (PyCFunction)_nc_direct_putstr_many, METH_VARARGS, NULL},
+    {"_nc_direct_hbar", (PyCFunction)_nc_direct_hbar, METH_VARARGS, NULL},
     {"_nc_direct_get_dim_x", (PyCFunction)_nc_direct_get_dim_x, METH_VARARGS, NULL},
     {"_nc_direct_get_dim_y", (PyCFunction)_nc_direct_get_dim_y, METH_VARARGS, NULL},
     {"_nc_direct_disable_cursor", (PyCFunction)_nc_direct_disable_cursor, METH_VARARGS, NULL},
     {"_nc_direct_enable_cursor", (PyCFunction)_nc_direct_enable_cursor, METH_VARARGS, NULL},
-    {"_nc_channels_set_background_rgb", (PyCFunction)_nc_channels_set_background_rgb, METH_VARARGS, NULL},
-    {"_nc_channels_set_foreground_rgb", (PyCFunction)_nc_channels_set_foreground_rgb, METH_VARARGS, NULL},
+    {"_nc_channels_set_background_rgb", (PyCFunction)(void (*)(void))_nc_channels_set_background_rgb, METH_FASTCALL, NULL},
+    {"_nc_channels_set_foreground_rgb", (PyCFunction)(void (*)(void))_nc_channels_set_foreground_rgb, METH_FASTCALL, NULL},
+    {"_nc_channels_get_value", (PyCFunction)_nc_channels_get_value, METH_VARARGS, NULL},
     {"_notcurses_context_init", (PyCFunction)_notcurses_context_init, METH_VARARGS, NULL},
     {"_notcurses_context_stop", (PyCFunction)_notcurses_context_stop, METH_VARARGS, NULL},
     {"_notcurses_context_render", (PyCFunction)_notcurses_context_render, METH_VARARGS, NULL},
+    {"_notcurses_context_render_to_buffer", (PyCFunction)_notcurses_context_render_to_buffer, METH_VARARGS, NULL},
+    {"_notcurses_context_render_to_file", (PyCFunction)_notcurses_context_render_to_file, METH_VARARGS, NULL},
     {"_notcurses_context_mouse_disable", (PyCFunction)_notcurses_context_mouse_disable, METH_VARARGS, NULL},
     {"_notcurses_context_mouse_enable", (PyCFunction)_notcurses_context_mouse_enable, METH_VARARGS, NULL},
     {"_notcurses_context_cursor_disable", (PyCFunction)_notcurses_context_cursor_disable, METH_VARARGS, NULL},
     {"_notcurses_context_cursor_enable", (PyCFunction)_notcurses_context_cursor_enable, METH_VARARGS, NULL},
     {"_notcurses_context_get_std_plane", (PyCFunction)_notcurses_context_get_std_plane, METH_VARARGS, NULL},
-    {"_nc_plane_set_background_rgb", (PyCFunction)_nc_plane_set_background_rgb, METH_VARARGS, NULL},
-    {"_nc_plane_set_foreground_rgb", (PyCFunction)_nc_plane_set_foreground_rgb, METH_VARARGS, NULL},
-    {"_nc_plane_putstr", (PyCFunction)_nc_plane_putstr, METH_VARARGS, NULL},
-    {"_nc_plane_putstr_aligned", (PyCFunction)_nc_plane_putstr_aligned, METH_VARARGS, NULL},
-    {"_nc_plane_dimensions_yx", (PyCFunction)_nc_plane_dimensions_yx, METH_VARARGS, NULL},
+    {"_notcurses_context_get_input_fd", (PyCFunction)_notcurses_context_get_input_fd, METH_VARARGS, NULL},
+    {"_notcurses_context_stats", (PyCFunction)_notcurses_context_stats, METH_VARARGS, NULL},
+    {"_nc_plane_set_background_rgb", (PyCFunction)(void (*)(void))_nc_plane_set_background_rgb, METH_FASTCALL, NULL},
+    {"_nc_plane_set_foreground_rgb", (PyCFunction)(void (*)(void))_nc_plane_set_foreground_rgb, METH_FASTCALL, NULL},
+    {"_nc_plane_putstr", (PyCFunction)(void (*)(void))_nc_plane_putstr, METH_FASTCALL, NULL},
+    {"_nc_plane_put_runs", (PyCFunction)_nc_plane_put_runs, METH_VARARGS, NULL},
+    {"_nc_plane_put_lines", (PyCFunction)_nc_plane_put_lines, METH_VARARGS, NULL},
+    {"_nc_plane_putstr_aligned", (PyCFunction)(void (*)(void))_nc_plane_putstr_aligned, METH_FASTCALL, NULL},
+    {"_nc_plane_dimensions_yx", (PyCFunction)(void (*)(void))_nc_plane_dimensions_yx, METH_FASTCALL, NULL},
     {"_nc_plane_polyfill_yx", (PyCFunction)_nc_plane_polyfill_yx, METH_VARARGS, NULL},
     {"_nc_plane_erase", (PyCFunction)_nc_plane_erase, METH_VARARGS, NULL},
     {"_nc_plane_create", (PyCFunction)_nc_plane_create, METH_VARARGS, NULL},
+    {"_nc_plane_destroy", (PyCFunction)_nc_plane_destroy, METH_VARARGS, NULL},
+    {"_nc_plane_move_yx", (PyCFunction)_nc_plane_move_yx, METH_VARARGS, NULL},
+    {"_nc_plane_resize_simple", (PyCFunction)_nc_plane_resize_simple, METH_VARARGS, NULL},
+    {"_nc_plane_yx", (PyCFunction)_nc_plane_yx, METH_VARARGS, NULL},
+    {"_nc_plane_reparent", (PyCFunction)_nc_plane_reparent, METH_VARARGS, NULL},
+    {"_nc_plane_move_top", (PyCFunction)_nc_plane_move_top, METH_VARARGS, NULL},
+    {"_nc_plane_move_bottom", (PyCFunction)_nc_plane_move_bottom, METH_VARARGS, NULL},
+    {"_nc_plane_move_above", (PyCFunction)_nc_plane_move_above, METH_VARARGS, NULL},
+    {"_nc_plane_move_below", (PyCFunction)_nc_plane_move_below, METH_VARARGS, NULL},
+    {"_nc_plane_set_scrolling", (PyCFunction)_nc_plane_set_scrolling, METH_VARARGS, NULL},
+    {"_nc_plane_blit_cells", (PyCFunction)_nc_plane_blit_cells, METH_VARARGS, NULL},
+    {"_nc_plane_blit_cells_diff", (PyCFunction)_nc_plane_blit_cells_diff, METH_VARARGS, NULL},
+    {"_nc_plane_snapshot", (PyCFunction)_nc_plane_snapshot, METH_VARARGS, NULL},
+    {"_nc_plane_blit_rgba", (PyCFunction)_nc_plane_blit_rgba, METH_VARARGS, NULL},
+    {"_nc_plane_hbar", (PyCFunction)_nc_plane_hbar, METH_VARARGS, NULL},
+    {"_nc_plane_gradient", (PyCFunction)_nc_plane_gradient, METH_VARARGS, NULL},
     {"_notcurses_context_get_input_blocking", (PyCFunction)_notcurses_context_get_input_blocking, METH_VARARGS, NULL},
+    {"_notcurses_context_get_input_nonblocking", (PyCFunction)_notcurses_context_get_input_nonblocking, METH_VARARGS, NULL},
+    {"_notcurses_context_get_input", (PyCFunction)_notcurses_context_get_input, METH_VARARGS, NULL},
+    {"_notcurses_context_drain_input", (PyCFunction)_notcurses_context_drain_input, METH_VARARGS, NULL},
+    {"_nc_input_codes", (PyCFunction)_nc_input_codes, METH_NOARGS, NULL},
     {"get_notcurses_version", (PyCFunction)get_notcurses_version_str, METH_NOARGS, NULL},
     {NULL, NULL, 0, NULL},
 };
@@ -886,6 +2656,9 @@ PyInit__notcurses(void)
     if (PyType_Ready(&NcInputType) < 0)
         return NULL;
 
+    if (PyType_Ready(&NcStatsType) < 0)
+        return NULL;
+
     py_module = PyModule_Create(&NotcursesModule);
     if (py_module == NULL)
         return NULL;
@@ -930,6 +2703,14 @@ PyInit__notcurses(void)
         return NULL;
     }
 
+    Py_INCREF(&NcStatsType);
+    if (PyModule_AddObject(py_module, "_NcStats", (PyObject *)&NcStatsType) < 0)
+    {
+        Py_DECREF(&NcStatsType);
+        Py_DECREF(py_module);
+        return NULL;
+    }
+
     // Constants PyModule_AddIntMacro(py_module, );
     int constants_control_value = 0;
     // Inputs
@@ -981,6 +2762,25 @@ PyInit__notcurses(void)
     constants_control_value |= PyModule_AddIntMacro(py_module, NCKEY_SCROLL_DOWN);
     constants_control_value |= PyModule_AddIntMacro(py_module, NCKEY_BUTTON6);
     constants_control_value |= PyModule_AddIntMacro(py_module, NCKEY_RELEASE);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCINPUT_MODIFIER_ALT);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCINPUT_MODIFIER_SHIFT);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCINPUT_MODIFIER_CTRL);
+    // Init options
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCOPTION_INHIBIT_SETLOCALE);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCOPTION_NO_WINCH_SIGHANDLER);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCOPTION_NO_QUIT_SIGHANDLERS);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCOPTION_SUPPRESS_BANNERS);
+    constants_control_value |= PyModule_AddIntMacro(py_module, NCOPTION_NO_ALTERNATE_SCREEN);
+    // Log levels
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_SILENT", NCLOGLEVEL_SILENT);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_PANIC", NCLOGLEVEL_PANIC);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_FATAL", NCLOGLEVEL_FATAL);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_ERROR", NCLOGLEVEL_ERROR);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_WARNING", NCLOGLEVEL_WARNING);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_INFO", NCLOGLEVEL_INFO);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_VERBOSE", NCLOGLEVEL_VERBOSE);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_DEBUG", NCLOGLEVEL_DEBUG);
+    constants_control_value |= PyModule_AddIntConstant(py_module, "NCLOGLEVEL_TRACE", NCLOGLEVEL_TRACE);
     // Nc Align
     constants_control_value |= PyModule_AddIntConstant(py_module, "NCALIGN_UNALIGNED", NCALIGN_UNALIGNED);
     constants_control_value |= PyModule_AddIntConstant(py_module, "NCALIGN_LEFT", NCALIGN_LEFT);
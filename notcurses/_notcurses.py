@@ -15,7 +15,7 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
 
 
 class _NcChannels:
@@ -64,6 +64,72 @@ class _NcInput:
         ...
 
 
+class _NcStats:
+    @property
+    def renders(self) -> int:
+        ...
+
+    @property
+    def failed_renders(self) -> int:
+        ...
+
+    @property
+    def render_bytes(self) -> int:
+        ...
+
+    @property
+    def render_max_bytes(self) -> int:
+        ...
+
+    @property
+    def render_min_bytes(self) -> int:
+        ...
+
+    @property
+    def render_ns(self) -> int:
+        ...
+
+    @property
+    def render_max_ns(self) -> int:
+        ...
+
+    @property
+    def render_min_ns(self) -> int:
+        ...
+
+    @property
+    def cell_elisions(self) -> int:
+        ...
+
+    @property
+    def cell_emissions(self) -> int:
+        ...
+
+    @property
+    def fg_elisions(self) -> int:
+        ...
+
+    @property
+    def fg_emissions(self) -> int:
+        ...
+
+    @property
+    def bg_elisions(self) -> int:
+        ...
+
+    @property
+    def bg_emissions(self) -> int:
+        ...
+
+    @property
+    def framebuffer_bytes(self) -> int:
+        ...
+
+    @property
+    def planes(self) -> int:
+        ...
+
+
 def _nc_direct_init(ncdirect: _NcDirect, /) -> None:
     ...
 
@@ -78,6 +144,19 @@ def _nc_direct_putstr(nc_direct: _NcDirect,
     ...
 
 
+def _nc_direct_putstr_many(nc_direct: _NcDirect,
+                           runs: Sequence[Tuple[str, int]], /) -> int:
+    ...
+
+
+def _nc_direct_hbar(nc_direct: _NcDirect,
+                    value: float, width: int,
+                    from_rgb: Tuple[int, int, int],
+                    to_rgb: Tuple[int, int, int],
+                    fill: str, /) -> int:
+    ...
+
+
 def _nc_direct_get_dim_x(nc_direct: _NcDirect, /) -> int:
     ...
 
@@ -106,7 +185,16 @@ def _nc_channels_set_foreground_rgb(
     ...
 
 
-def _notcurses_context_init(nc_context: _NotcursesContext, /) -> None:
+def _nc_channels_get_value(nc_channels: _NcChannels, /) -> int:
+    ...
+
+
+def _notcurses_context_init(
+        nc_context: _NotcursesContext,
+        flags: int, log_level: int,
+        margin_top: int, margin_right: int,
+        margin_bottom: int, margin_left: int,
+        output_fd: int, /) -> None:
     ...
 
 
@@ -118,6 +206,16 @@ def _notcurses_context_render(nc_context: _NotcursesContext, /) -> None:
     ...
 
 
+def _notcurses_context_render_to_buffer(
+        nc_context: _NotcursesContext, /) -> bytes:
+    ...
+
+
+def _notcurses_context_render_to_file(
+        nc_context: _NotcursesContext, fd: int, /) -> None:
+    ...
+
+
 def _notcurses_context_mouse_disable(nc_context: _NotcursesContext, /) -> None:
     ...
 
@@ -142,11 +240,37 @@ def _notcurses_context_get_std_plane(
     ...
 
 
+def _notcurses_context_get_input_fd(
+        nc_context: _NotcursesContext, /) -> int:
+    ...
+
+
+def _notcurses_context_stats(
+        nc_context: _NotcursesContext, reset: bool, /) -> _NcStats:
+    ...
+
+
 def _notcurses_context_get_input_blocking(
         nc_context: _NotcursesContext, /) -> _NcInput:
     ...
 
 
+def _notcurses_context_get_input_nonblocking(
+        nc_context: _NotcursesContext, /) -> Optional[_NcInput]:
+    ...
+
+
+def _notcurses_context_get_input(
+        nc_context: _NotcursesContext, timeout: float, /) -> Optional[_NcInput]:
+    ...
+
+
+def _notcurses_context_drain_input(
+        nc_context: _NotcursesContext,
+        max_events: int, /) -> Tuple[bytes, bytes, bytes, bytes, bytes]:
+    ...
+
+
 def _nc_plane_set_background_rgb(
         nc_plane: _NcPlane,
         red: int, green: int, blue: int, /) -> None:
@@ -161,10 +285,24 @@ def _nc_plane_set_foreground_rgb(
 
 def _nc_plane_putstr(
         nc_plane: _NcPlane, string: str,
+        y_pos: int, x_pos: int,
+        nc_channels: Optional[_NcChannels] = None, /) -> int:
+    ...
+
+
+def _nc_plane_put_runs(
+        nc_plane: _NcPlane,
+        runs: Sequence[Tuple[str, Optional[_NcChannels]]],
         y_pos: int, x_pos: int, /) -> int:
     ...
 
 
+def _nc_plane_put_lines(
+        nc_plane: _NcPlane, lines_iter: Iterable[str],
+        y_pos: int, wrap_lines: bool, /) -> int:
+    ...
+
+
 def _nc_plane_putstr_aligned(
         nc_plane: _NcPlane, string: str,
         y_pos: int, align: int, /) -> int:
@@ -192,6 +330,107 @@ def _nc_plane_create(
     ...
 
 
+def _nc_plane_destroy(nc_plane: _NcPlane, /) -> None:
+    ...
+
+
+def _nc_plane_move_yx(nc_plane: _NcPlane, y_pos: int, x_pos: int, /) -> None:
+    ...
+
+
+def _nc_plane_resize_simple(
+        nc_plane: _NcPlane, rows_num: int, cols_num: int, /) -> None:
+    ...
+
+
+def _nc_plane_yx(nc_plane: _NcPlane, /) -> Tuple[int, int]:
+    ...
+
+
+def _nc_plane_reparent(nc_plane: _NcPlane, new_parent: _NcPlane, /) -> None:
+    ...
+
+
+def _nc_plane_move_top(nc_plane: _NcPlane, /) -> None:
+    ...
+
+
+def _nc_plane_move_bottom(nc_plane: _NcPlane, /) -> None:
+    ...
+
+
+def _nc_plane_move_above(
+        nc_plane: _NcPlane, other_plane: _NcPlane, /) -> None:
+    ...
+
+
+def _nc_plane_move_below(
+        nc_plane: _NcPlane, other_plane: _NcPlane, /) -> None:
+    ...
+
+
+def _nc_plane_set_scrolling(
+        nc_plane: _NcPlane, scrolling: bool, /) -> bool:
+    ...
+
+
+def _nc_plane_blit_cells(
+        nc_plane: _NcPlane,
+        chars: object, foreground: Optional[object],
+        background: Optional[object],
+        y_pos: int, x_pos: int, cols_num: int, /) -> int:
+    ...
+
+
+def _nc_plane_blit_cells_diff(
+        nc_plane: _NcPlane,
+        chars: object, foreground: Optional[object],
+        background: Optional[object],
+        prev_chars: object, prev_foreground: Optional[object],
+        prev_background: Optional[object],
+        y_pos: int, x_pos: int, rows_num: int, cols_num: int, /) -> int:
+    ...
+
+
+def _nc_plane_snapshot(
+        nc_plane: _NcPlane,
+        y_pos: int, x_pos: int,
+        rows_num: int, cols_num: int, /) -> Tuple[bytes, bytes]:
+    ...
+
+
+def _nc_plane_blit_rgba(
+        nc_plane: _NcPlane, rgba_buffer: object,
+        rows_num: int, cols_num: int, row_stride: int,
+        scale: int, y_pos: int, x_pos: int, /) -> None:
+    ...
+
+
+def _nc_plane_hbar(
+        nc_plane: _NcPlane,
+        y_pos: int, x_pos: int,
+        value: float, width: int,
+        from_rgb: Tuple[int, int, int],
+        to_rgb: Tuple[int, int, int],
+        fill: str, /) -> int:
+    ...
+
+
+def _nc_plane_gradient(
+        nc_plane: _NcPlane, fill: str,
+        top_left: Tuple[int, int, int],
+        top_right: Tuple[int, int, int],
+        bottom_left: Tuple[int, int, int],
+        bottom_right: Tuple[int, int, int],
+        y_pos: int, x_pos: int,
+        y_stop: int, x_stop: int, /) -> int:
+    ...
+
+
+def _nc_input_codes() -> Tuple[Tuple[str, int], ...]:
+    ...
+
+
 def get_notcurses_version() -> str:
     """Returns notcurses version from library"""
     ...
@@ -246,6 +485,23 @@ NCKEY_SCROLL_UP: int = 0
 NCKEY_SCROLL_DOWN: int = 0
 NCKEY_BUTTON6: int = 0
 NCKEY_RELEASE: int = 0
+NCINPUT_MODIFIER_ALT: int = 0
+NCINPUT_MODIFIER_SHIFT: int = 0
+NCINPUT_MODIFIER_CTRL: int = 0
+NCOPTION_INHIBIT_SETLOCALE: int = 0
+NCOPTION_NO_WINCH_SIGHANDLER: int = 0
+NCOPTION_NO_QUIT_SIGHANDLERS: int = 0
+NCOPTION_SUPPRESS_BANNERS: int = 0
+NCOPTION_NO_ALTERNATE_SCREEN: int = 0
+NCLOGLEVEL_SILENT: int = 0
+NCLOGLEVEL_PANIC: int = 0
+NCLOGLEVEL_FATAL: int = 0
+NCLOGLEVEL_ERROR: int = 0
+NCLOGLEVEL_WARNING: int = 0
+NCLOGLEVEL_INFO: int = 0
+NCLOGLEVEL_VERBOSE: int = 0
+NCLOGLEVEL_DEBUG: int = 0
+NCLOGLEVEL_TRACE: int = 0
 NCALIGN_UNALIGNED: int = 0
 NCALIGN_LEFT: int = 0
 NCALIGN_CENTER: int = 0
@@ -0,0 +1,349 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+NcDirect and NcChannels
+
+Kept apart from the context and plane classes so that
+tools which only use NcDirect import as little as possible.
+"""
+from __future__ import annotations
+
+from ._notcurses import (_nc_channels_get_value,
+                         _nc_channels_set_background_rgb,
+                         _nc_channels_set_foreground_rgb,
+                         _nc_direct_disable_cursor, _nc_direct_enable_cursor,
+                         _nc_direct_get_dim_x, _nc_direct_get_dim_y,
+                         _nc_direct_hbar, _nc_direct_init, _nc_direct_putstr,
+                         _nc_direct_putstr_many, _nc_direct_stop, _NcChannels,
+                         _NcDirect)
+
+# typing is only imported by type checkers to keep the import fast
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+
+class NcChannels:
+    """
+    Class that hold the colors and transparency values
+
+    Can be used in some functions instead of directly specifying colors.
+
+    Channels created by :py:meth:`from_rgb` are immutable
+    and shared between callers.
+    """
+
+    def __init__(self) -> None:
+        self._nc_channels = _NcChannels()
+        self._frozen_value: Optional[int] = None
+
+    @classmethod
+    def from_rgb(cls,
+                 foreground: Tuple[int, int, int],
+                 background: Tuple[int, int, int]) -> NcChannels:
+        """
+        Returns immutable channels with the given colors.
+
+        The channels are cached so the same colors return the
+        same object. Least recently used colors are evicted once
+        the cache holds 256 pairs.
+
+        :param Tuple[int,int,int] foreground: Foreground red, green and blue
+        :param Tuple[int,int,int] background: Background red, green and blue
+        :rtype: NcChannels
+        """
+        return _nc_channels_from_rgb(foreground, background)
+
+    @property
+    def value(self) -> int:
+        """
+        Foreground and background channels packed in a 64-bit integer
+
+        :rtype: int
+        """
+        if self._frozen_value is not None:
+            return self._frozen_value
+
+        return _nc_channels_get_value(self._nc_channels)
+
+    @property
+    def is_immutable(self) -> bool:
+        """
+        Were the channels created by :py:meth:`from_rgb`?
+
+        :rtype: bool
+        """
+        return self._frozen_value is not None
+
+    def has_same_value(self, other: NcChannels) -> bool:
+        """
+        Do both channels hold the same colors and transparency?
+
+        :param NcChannels other: Channels to compare with
+        :rtype: bool
+        """
+        return self.value == other.value
+
+    def _check_mutable(self) -> None:
+        if self._frozen_value is not None:
+            raise TypeError("NcChannels created by from_rgb are immutable")
+
+    def set_background_rgb(self, red: int, green: int, blue: int) -> None:
+        """
+        Sets the background color
+
+        :param int red: Red color component given as integer from 0 to 255
+        :param int green: Green color component given as integer from 0 to 255
+        :param int blue: Blue color component given as integer from 0 to 255
+        """
+        self._check_mutable()
+        _nc_channels_set_background_rgb(
+            self._nc_channels,
+            red, green, blue,
+        )
+
+    def set_foreground_rgb(self, red: int, green: int, blue: int) -> None:
+        """
+        Sets the foreground color
+
+        :param int red: Red color component given as integer from 0 to 255
+        :param int green: Green color component given as integer from 0 to 255
+        :param int blue: Blue color component given as integer from 0 to 255
+        """
+        self._check_mutable()
+        _nc_channels_set_foreground_rgb(
+            self._nc_channels,
+            red, green, blue,
+        )
+
+
+# Dict keeps the insertion order, so the first key is the least recently used
+_NC_CHANNELS_CACHE_SIZE = 256
+_nc_channels_cache: Dict[
+    Tuple[Tuple[int, int, int], Tuple[int, int, int]], NcChannels] = {}
+
+
+def _nc_channels_from_rgb(
+        foreground: Tuple[int, int, int],
+        background: Tuple[int, int, int]) -> NcChannels:
+    key = (foreground, background)
+    try:
+        nc_channels = _nc_channels_cache.pop(key)
+    except KeyError:
+        nc_channels = NcChannels()
+        nc_channels.set_foreground_rgb(*foreground)
+        nc_channels.set_background_rgb(*background)
+        nc_channels._frozen_value = nc_channels.value
+        if len(_nc_channels_cache) >= _NC_CHANNELS_CACHE_SIZE:
+            del _nc_channels_cache[next(iter(_nc_channels_cache))]
+
+    _nc_channels_cache[key] = nc_channels
+    return nc_channels
+
+
+class NcDirect:
+    """
+    NcDirect is a subset of Notcurses.
+    It does not clear entire terminal but instead draws on to normal
+    terminal surface. That means the output is preserved after the application
+    has exited and can be scrolled back.
+
+    NcDirect has only one main plane.
+    """
+
+    def __init__(self,
+                 start_immediately: bool = True):
+        """
+        Create the main direct plane.
+
+        :param bool start_immediately: Whether or not to start NcDirect on
+            initialization.
+        """
+        self._nc_direct = _NcDirect()
+        self._is_cursor_enabled: Optional[bool] = None
+        self._has_started = False
+        self._batch_runs: Optional[List[Tuple[str, int]]] = None
+        if start_immediately:
+            self.start()
+
+    def __del__(self) -> None:
+        if self._has_started:
+            self.stop()
+
+    def start(self) -> None:
+        """
+        Start NcDirect.
+        """
+        _nc_direct_init(self._nc_direct)
+        self._has_started = True
+
+    def stop(self) -> None:
+        """
+        Stop NcDirect
+
+        Will be automatically called if NcDirect object gets garbage collected
+        """
+        _nc_direct_stop(self._nc_direct)
+
+    def putstr(
+            self, string: str,
+            nc_channels: Optional[NcChannels] = None) -> int:
+        """
+        Puts a string on the plane.
+        This will immediately take effect. There is not `render` function for
+        NcDirect.
+
+        Inside :py:meth:`batch` the string is queued instead
+        and nothing is written yet.
+
+        :param Optional[NcChannels] nc_channels: The colors string will use
+        :returns: Number of characters written.
+            0 if the string was queued by :py:meth:`batch`.
+        :rtype: int
+        """
+        if self._batch_runs is not None:
+            self._batch_runs.append(
+                (string,
+                 nc_channels.value if nc_channels is not None else 0)
+            )
+            return 0
+
+        return _nc_direct_putstr(
+            self._nc_direct,
+            string,
+            nc_channels._nc_channels
+            if nc_channels is not None else nc_channels,
+        )
+
+    def putstr_many(
+            self,
+            runs: Iterable[Tuple[str, Optional[NcChannels]]]) -> int:
+        """
+        Puts many strings with their colors in a single call.
+
+        Consecutive strings with the same colors are merged and
+        the output is flushed once at the end.
+
+        :param runs: Pairs of string and colors it will use
+        :type runs: Iterable[Tuple[str, Optional[NcChannels]]]
+        :returns: Number of characters written.
+        :rtype: int
+        """
+        return _nc_direct_putstr_many(
+            self._nc_direct,
+            [(string, nc_channels.value if nc_channels is not None else 0)
+             for string, nc_channels in runs],
+        )
+
+    def hbar(
+            self, value: float, width: int,
+            from_rgb: Tuple[int, int, int], to_rgb: Tuple[int, int, int],
+            fill: str = ' ') -> int:
+        """
+        Puts a horizontal bar with a color gradient.
+
+        The colors of the blocks are computed in C.
+        A bar of full width goes from `from_rgb` to `to_rgb`,
+        a shorter bar stops partway.
+
+        :param float value: How much of the bar to fill from 0.0 to 1.0
+        :param int width: Width of the full bar in columns
+        :param Tuple[int,int,int] from_rgb: Color of the first block
+        :param Tuple[int,int,int] to_rgb: Color at the end of full bar
+        :param str fill: Character of each block
+        :returns: Number of blocks written
+        :rtype: int
+        """
+        if self._batch_runs:
+            _nc_direct_putstr_many(self._nc_direct, self._batch_runs)
+            self._batch_runs.clear()
+
+        return _nc_direct_hbar(
+            self._nc_direct,
+            value, width, from_rgb, to_rgb, fill,
+        )
+
+    def batch(self) -> _NcDirectBatch:
+        """
+        Context manager that queues :py:meth:`putstr` calls
+        and writes them with :py:meth:`putstr_many` on exit.
+
+        Colors are captured when :py:meth:`putstr` is called so the same
+        :py:class:`NcChannels` can be changed between calls.
+        If the body raises an exception the queued strings are discarded.
+        Usage::
+
+            with nc_direct.batch():
+                for ...:
+                    nc_direct.putstr('X', channels)
+        """
+        return _NcDirectBatch(self)
+
+    @property
+    def dimensions_yx(self) -> Tuple[int, int]:
+        """
+        Returns Y and X dimensions of the plane
+
+        :rtype: Tuple[int, int]
+        """
+        return (_nc_direct_get_dim_y(self._nc_direct),
+                _nc_direct_get_dim_x(self._nc_direct))
+
+    @property
+    def cursor_enabled(self) -> Optional[bool]:
+        """
+        Is the cursor enabled?
+
+        Assign boolean to enable or disable cursor.
+
+        :type: bool
+        :rtype: bool
+        """
+        return self._is_cursor_enabled
+
+    @cursor_enabled.setter
+    def cursor_enabled(self, set_to_what: Optional[bool]) -> None:
+        self._is_cursor_enabled = set_to_what
+        if set_to_what:
+            _nc_direct_enable_cursor(self._nc_direct)
+        else:
+            _nc_direct_disable_cursor(self._nc_direct)
+
+
+class _NcDirectBatch:
+    # Written as a class so the module does not import contextlib
+    def __init__(self, nc_direct: NcDirect) -> None:
+        self._nc_direct = nc_direct
+        self._is_outermost = False
+
+    def __enter__(self) -> None:
+        if self._nc_direct._batch_runs is None:
+            self._nc_direct._batch_runs = []
+            self._is_outermost = True
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType]) -> None:
+        if not self._is_outermost:
+            return
+
+        batch_runs = self._nc_direct._batch_runs
+        self._nc_direct._batch_runs = None
+        if exc_type is None and batch_runs is not None:
+            _nc_direct_putstr_many(self._nc_direct._nc_direct, batch_runs)
@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+
+# Copyright 2020 igo95862
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Special keys of NcInput
+
+Imported on the first use to keep importing notcurses fast.
+"""
+from __future__ import annotations
+
+from enum import IntEnum
+
+from . import _notcurses
+from ._notcurses import _nc_input_codes
+
+# typing is only imported by type checkers to keep the import fast
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict
+
+
+class NcInputCodes(IntEnum):
+    """
+    Enum containing special keys mapping
+
+    :cvar INVALID:
+    :cvar UP:
+    :cvar RESIZE:
+    :cvar RIGHT:
+    :cvar DOWN:
+    :cvar LEFT:
+    :cvar INSERT:
+    :cvar DELETE:
+    :cvar BACKSPACE:
+    :cvar PAGE_DOWN:
+    :cvar PAGE_UP:
+    :cvar HOME:
+    :cvar EBD:
+    :cvar F0:
+    :cvar F1:
+    :cvar F2:
+    :cvar F3:
+    :cvar F4:
+    :cvar F5:
+    :cvar F6:
+    :cvar F7:
+    :cvar F8:
+    :cvar F9:
+    :cvar F10:
+    :cvar F11:
+    :cvar F12:
+    :cvar ENTER:
+    :cvar CAPS_LOCL:
+    :cvar DOWN_LEFT:
+    :cvar DOWN_RIGHT:
+    :cvar UP_LEFT:
+    :cvar UP_RIGHT:
+    :cvar CENTER:
+    :cvar BEGIN:
+    :cvar CANCEL:
+    :cvar CLOSE:
+    :cvar COMMAND:
+    :cvar COPY:
+    :cvar EXIT:
+    :cvar PRINT:
+    :cvar REFRESH:
+    :cvar MOUSE_LEFT_BUTTON:
+    :cvar MOUSE_MIDDLE_BUTTON:
+    :cvar MOUSE_RIGHT_BUTTON:
+    :cvar MOUSE_SCROLL_UP:
+    :cvar MOUSE_SCROLL_DOWN:
+    :cvar MOUSE_6:
+    :cvar MOUSE_RELEASE:
+    """
+    INVALID = _notcurses.NCKEY_INVALID
+    UP = _notcurses.NCKEY_UP
+    RESIZE = _notcurses.NCKEY_RESIZE
+    RIGHT = _notcurses.NCKEY_RIGHT
+    DOWN = _notcurses.NCKEY_DOWN
+    LEFT = _notcurses.NCKEY_LEFT
+    INSERT = _notcurses.NCKEY_INS
+    DELETE = _notcurses.NCKEY_DEL
+    BACKSPACE = _notcurses.NCKEY_BACKSPACE
+    PAGE_DOWN = _notcurses.NCKEY_PGDOWN
+    PAGE_UP = _notcurses.NCKEY_PGUP
+    HOME = _notcurses.NCKEY_HOME
+    EBD = _notcurses.NCKEY_END
+    F0 = _notcurses.NCKEY_F00
+    F1 = _notcurses.NCKEY_F01
+    F2 = _notcurses.NCKEY_F02
+    F3 = _notcurses.NCKEY_F03
+    F4 = _notcurses.NCKEY_F04
+    F5 = _notcurses.NCKEY_F05
+    F6 = _notcurses.NCKEY_F06
+    F7 = _notcurses.NCKEY_F07
+    F8 = _notcurses.NCKEY_F08
+    F9 = _notcurses.NCKEY_F09
+    F10 = _notcurses.NCKEY_F10
+    F11 = _notcurses.NCKEY_F11
+    F12 = _notcurses.NCKEY_F12
+    ENTER = _notcurses.NCKEY_ENTER
+    CAPS_LOCL = _notcurses.NCKEY_CLS
+    DOWN_LEFT = _notcurses.NCKEY_DLEFT
+    DOWN_RIGHT = _notcurses.NCKEY_DRIGHT
+    UP_LEFT = _notcurses.NCKEY_ULEFT
+    UP_RIGHT = _notcurses.NCKEY_URIGHT
+    CENTER = _notcurses.NCKEY_CENTER
+    BEGIN = _notcurses.NCKEY_BEGIN
+    CANCEL = _notcurses.NCKEY_CANCEL
+    CLOSE = _notcurses.NCKEY_CLOSE
+    COMMAND = _notcurses.NCKEY_COMMAND
+    COPY = _notcurses.NCKEY_COPY
+    EXIT = _notcurses.NCKEY_EXIT
+    PRINT = _notcurses.NCKEY_PRINT
+    REFRESH = _notcurses.NCKEY_REFRESH
+    MOUSE_LEFT_BUTTON = _notcurses.NCKEY_BUTTON1
+    MOUSE_MIDDLE_BUTTON = _notcurses.NCKEY_BUTTON2
+    MOUSE_RIGHT_BUTTON = _notcurses.NCKEY_BUTTON3
+    MOUSE_SCROLL_UP = _notcurses.NCKEY_SCROLL_UP
+    MOUSE_SCROLL_DOWN = _notcurses.NCKEY_SCROLL_DOWN
+    MOUSE_6 = _notcurses.NCKEY_BUTTON6
+    MOUSE_RELEASE = _notcurses.NCKEY_RELEASE
+
+
+NC_INPUT_CODES: Dict[int, NcInputCodes] = {
+    element.value: element for element in NcInputCodes
+}
+
+# The key table of the C extension is checked so the enum can not drift
+if tuple((name, element.value)
+         for name, element in NcInputCodes.__members__.items()
+         ) != _nc_input_codes():
+    raise RuntimeError('NcInputCodes do not match the C extension key table')
@@ -18,29 +18,58 @@ Notcurses python module
 """
 from __future__ import annotations
 
+from array import array
+from collections import OrderedDict, deque
 from enum import IntEnum
-from typing import Dict, Iterable, Optional, Tuple, Union
+from functools import lru_cache
+from itertools import islice
+from threading import Lock, RLock
+from time import monotonic
+from weakref import WeakSet
 
 from . import _notcurses
-from ._notcurses import (_nc_channels_set_background_rgb,
-                         _nc_channels_set_foreground_rgb,
-                         _nc_direct_disable_cursor, _nc_direct_enable_cursor,
-                         _nc_direct_get_dim_x, _nc_direct_get_dim_y,
-                         _nc_direct_init, _nc_direct_putstr, _nc_direct_stop,
-                         _nc_plane_create, _nc_plane_dimensions_yx,
-                         _nc_plane_erase, _nc_plane_putstr,
-                         _nc_plane_putstr_aligned,
-                         _nc_plane_set_background_rgb,
-                         _nc_plane_set_foreground_rgb, _NcChannels, _NcDirect,
-                         _NcInput, _NcPlane, _notcurses_context_cursor_disable,
+from ._notcurses import (_nc_plane_blit_cells, _nc_plane_blit_cells_diff,
+                         _nc_plane_blit_rgba, _nc_plane_create,
+                         _nc_plane_destroy, _nc_plane_dimensions_yx,
+                         _nc_plane_erase, _nc_plane_gradient, _nc_plane_hbar,
+                         _nc_plane_move_above, _nc_plane_move_below,
+                         _nc_plane_move_bottom, _nc_plane_move_top,
+                         _nc_plane_move_yx, _nc_plane_put_lines,
+                         _nc_plane_put_runs, _nc_plane_putstr,
+                         _nc_plane_putstr_aligned, _nc_plane_reparent,
+                         _nc_plane_resize_simple, _nc_plane_set_background_rgb,
+                         _nc_plane_set_foreground_rgb, _nc_plane_set_scrolling,
+                         _nc_plane_snapshot, _nc_plane_yx, _NcInput, _NcPlane,
+                         _NcStats, _notcurses_context_cursor_disable,
                          _notcurses_context_cursor_enable,
+                         _notcurses_context_drain_input,
+                         _notcurses_context_get_input,
                          _notcurses_context_get_input_blocking,
+                         _notcurses_context_get_input_fd,
+                         _notcurses_context_get_input_nonblocking,
                          _notcurses_context_get_std_plane,
                          _notcurses_context_init,
                          _notcurses_context_mouse_disable,
                          _notcurses_context_mouse_enable,
-                         _notcurses_context_render, _notcurses_context_stop,
+                         _notcurses_context_render,
+                         _notcurses_context_render_to_buffer,
+                         _notcurses_context_render_to_file,
+                         _notcurses_context_stats, _notcurses_context_stop,
                          _NotcursesContext)
+from .direct import NcChannels
+
+# typing is only imported by type checkers to keep the import fast
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from asyncio import Future
+    from types import TracebackType
+    from typing import (AsyncIterator, Callable, Deque, Dict, Iterable,
+                        Iterator, List, Optional, Tuple, Type, Union)
+
+    from .input_codes import NcInputCodes
+
+# Hidden planes are moved this far away from the visible area
+_OFF_SCREEN_POS = -(1 << 16)
 
 
 class NcAlign(IntEnum):
@@ -58,6 +87,44 @@ class NcAlign(IntEnum):
     RIGHT = _notcurses.NCALIGN_RIGHT
 
 
+class NcScale(IntEnum):
+    """
+    Enum containing image scaling types
+
+    :cvar NONE: Image is not scaled
+    :cvar SCALE: Image is scaled to the plane keeping the aspect ratio
+    :cvar STRETCH: Image is stretched to fill the plane
+    """
+    NONE = _notcurses.NCSCALE_NONE
+    SCALE = _notcurses.NCSCALE_SCALE
+    STRETCH = _notcurses.NCSCALE_STRETCH
+
+
+class NcLogLevel(IntEnum):
+    """
+    Enum containing notcurses logging levels
+
+    :cvar SILENT: Print nothing
+    :cvar PANIC: Print diagnostics before crashing
+    :cvar FATAL: Print errors that will stop notcurses
+    :cvar ERROR: Print errors
+    :cvar WARNING: Print warnings
+    :cvar INFO: Print informational messages
+    :cvar VERBOSE: Print verbose messages
+    :cvar DEBUG: Print debugging messages
+    :cvar TRACE: Print everything
+    """
+    SILENT = _notcurses.NCLOGLEVEL_SILENT
+    PANIC = _notcurses.NCLOGLEVEL_PANIC
+    FATAL = _notcurses.NCLOGLEVEL_FATAL
+    ERROR = _notcurses.NCLOGLEVEL_ERROR
+    WARNING = _notcurses.NCLOGLEVEL_WARNING
+    INFO = _notcurses.NCLOGLEVEL_INFO
+    VERBOSE = _notcurses.NCLOGLEVEL_VERBOSE
+    DEBUG = _notcurses.NCLOGLEVEL_DEBUG
+    TRACE = _notcurses.NCLOGLEVEL_TRACE
+
+
 class NotcursesContext:
     """
     Notcurses Context
@@ -67,17 +134,73 @@ class NotcursesContext:
 
     Using :py:func:`get_std_plane` is recommended in most cases instead
     of directly initializing the context.
+
+    Rendering and waiting for input release the GIL so other Python
+    threads keep running while the terminal is busy.
+
+    :ivar RLock lock: Per-context lock held during :py:meth:`render`
+        and by the plane methods that release the GIL, such as
+        :py:meth:`NcPlane.blit_cells` and :py:meth:`NcPlane.snapshot`.
+        Threads that modify planes of this context with other methods
+        while another thread renders should hold this lock while doing so.
+    :ivar Optional[float] max_fps: Maximum number of frames per second
+        rendered by :py:meth:`request_render` and :py:meth:`render_async`.
+        None or a value not above 0 means no limit.
     """
 
     def __init__(self,
-                 start_immediately: bool = True):
+                 start_immediately: bool = True,
+                 max_fps: Optional[float] = 60.0,
+                 *,
+                 suppress_banners: bool = False,
+                 no_alternate_screen: bool = False,
+                 no_signal_handlers: bool = False,
+                 inhibit_setlocale: bool = False,
+                 margins: Tuple[int, int, int, int] = (0, 0, 0, 0),
+                 log_level: NcLogLevel = NcLogLevel.SILENT,
+                 output_fd: Optional[int] = None):
         """
         Create the context
 
         :param bool start_immediately: Whether or not to acquire the terminal
+        :param Optional[float] max_fps: Frame rate limit of
+            :py:meth:`request_render` and :py:meth:`render_async`.
+            None or a value not above 0 disables the limit.
+        :param bool suppress_banners: Do not print version and
+            statistics banners on start and stop
+        :param bool no_alternate_screen: Draw on the normal screen
+            instead of the alternate one
+        :param bool no_signal_handlers: Do not install signal handlers
+            for window resizing and termination
+        :param bool inhibit_setlocale: Do not call setlocale on start
+        :param Tuple[int,int,int,int] margins: Top, right, bottom and left
+            margins of the rendering area
+        :param NcLogLevel log_level: Which messages notcurses should print
+        :param Optional[int] output_fd: File descriptor to draw on instead
+            of standard output, for example a pseudo terminal.
+            The descriptor is duplicated and can be closed by the caller.
         """
         self._nc_context = _NotcursesContext()
+        self._init_flags = 0
+        if suppress_banners:
+            self._init_flags |= _notcurses.NCOPTION_SUPPRESS_BANNERS
+        if no_alternate_screen:
+            self._init_flags |= _notcurses.NCOPTION_NO_ALTERNATE_SCREEN
+        if no_signal_handlers:
+            self._init_flags |= (_notcurses.NCOPTION_NO_WINCH_SIGHANDLER
+                                 | _notcurses.NCOPTION_NO_QUIT_SIGHANDLERS)
+        if inhibit_setlocale:
+            self._init_flags |= _notcurses.NCOPTION_INHIBIT_SETLOCALE
+        self._margins = margins
+        self._log_level = log_level
+        self._output_fd = output_fd
         self._has_started = False
+        self.lock = RLock()
+        self._input_lock = Lock()
+        self._render_future: Optional[Future[None]] = None
+        self.max_fps = max_fps
+        self._needs_render = True
+        self._last_render_time = 0.0
         if start_immediately:
             self.start()
 
@@ -87,14 +210,124 @@ class NotcursesContext:
         This should be called after the you have filled the
         plane with such function as :py:meth:`NcPlane.put_lines`
 
-        .. warning::
-            This method is not thread safe.
+        Holds :py:attr:`lock` while rendering.
+        """
+        with self.lock:
+            self._needs_render = False
+            self._last_render_time = monotonic()
+            _notcurses_context_render(self._nc_context)
+
+    def render_to_buffer(self) -> bytes:
+        """
+        Renders the frame and returns it instead of writing it out
+
+        The bytes are the escape sequences that :py:meth:`render` would
+        write to the terminal. Nothing is written to the terminal,
+        but the frame counts as the last one, so the next frame
+        only contains the changes.
+        Useful for testing frames and measuring output size.
+
+        Holds :py:attr:`lock` while rendering.
+
+        :rtype: bytes
+        """
+        with self.lock:
+            self._needs_render = False
+            self._last_render_time = monotonic()
+            return _notcurses_context_render_to_buffer(self._nc_context)
+
+    def render_to_fd(self, fd: int) -> None:
+        """
+        Renders the frame and writes it to the file descriptor
+        instead of the terminal
+
+        Holds :py:attr:`lock` while rendering.
+
+        :param int fd: File descriptor to write to.
+            It is not closed.
+        """
+        with self.lock:
+            self._needs_render = False
+            self._last_render_time = monotonic()
+            _notcurses_context_render_to_file(self._nc_context, fd)
+
+    @property
+    def needs_render(self) -> bool:
+        """
+        Was any plane of this context changed since the last render?
+
+        :rtype: bool
+        """
+        return self._needs_render
+
+    def mark_dirty(self) -> None:
         """
-        _notcurses_context_render(self._nc_context)
+        Marks the context as needing a render.
+
+        Methods of :py:class:`NcPlane` that change the content
+        call this automatically.
+        """
+        self._needs_render = True
+
+    def time_until_render(self) -> Optional[float]:
+        """
+        Returns how many seconds :py:meth:`request_render` has to wait
+        before the next frame is allowed.
+
+        :returns: Seconds to wait, 0.0 if render is allowed now
+            or None if nothing changed.
+        :rtype: Optional[float]
+        """
+        if not self._needs_render:
+            return None
+
+        if self.max_fps is None or self.max_fps <= 0:
+            return 0.0
+
+        next_render_time = self._last_render_time + 1.0 / self.max_fps
+        return max(0.0, next_render_time - monotonic())
+
+    def request_render(self) -> Optional[float]:
+        """
+        Renders only if some plane changed and the frame rate limit allows.
+
+        Widgets can call it after every update. Requests that arrive
+        faster than :py:attr:`max_fps` are not rendered. The caller
+        should call it again after the returned delay so the last
+        change gets rendered, for example with ``loop.call_later``.
+        Nothing is rendered from other threads behind the caller's back.
+
+        :returns: Seconds to wait before calling again
+            or None if there is nothing left to render.
+        :rtype: Optional[float]
+        """
+        delay = self.time_until_render()
+        if delay is None:
+            return None
+
+        if delay > 0.0:
+            return delay
+
+        self.render()
+        return None
+
+    def stats(self, reset: bool = False) -> NcStats:
+        """
+        Returns rendering statistics collected by notcurses
+
+        :param bool reset: Reset the statistics after reading them
+        :rtype: NcStats
+        """
+        return NcStats(_notcurses_context_stats(self._nc_context, reset))
 
     def start(self) -> None:
         """Notcurses acquires the terminal."""
-        _notcurses_context_init(self._nc_context)
+        _notcurses_context_init(
+            self._nc_context,
+            self._init_flags, self._log_level,
+            *self._margins,
+            self._output_fd if self._output_fd is not None else -1,
+        )
         self._has_started = True
 
     def stop(self) -> None:
@@ -104,16 +337,144 @@ class NotcursesContext:
         This will be automatically called with the context object
         gets garbage collected.
         """
-        _notcurses_context_stop(self._nc_context)
-        self._has_started = False
+        with self.lock:
+            _notcurses_context_stop(self._nc_context)
+            self._has_started = False
 
     def get_input_blocking(self) -> NcInput:
         """
         Waits synchronously for an :py:class:`NcInput` event.
+
+        Other threads are not blocked while waiting.
+        Only one thread can wait for input at a time.
         """
-        return NcInput(
-            _notcurses_context_get_input_blocking(self._nc_context)
-        )
+        with self._input_lock:
+            return NcInput(
+                _notcurses_context_get_input_blocking(self._nc_context)
+            )
+
+    def get_input_nonblocking(self) -> Optional[NcInput]:
+        """
+        Returns a pending :py:class:`NcInput` event without waiting.
+
+        Call it in a loop to drain every pending event.
+
+        :returns: Input event or None if there is no pending input.
+        :rtype: Optional[NcInput]
+        """
+        with self._input_lock:
+            nc_input = _notcurses_context_get_input_nonblocking(
+                self._nc_context)
+
+        return NcInput(nc_input) if nc_input is not None else None
+
+    def get_input(self, timeout: float) -> Optional[NcInput]:
+        """
+        Waits for an :py:class:`NcInput` event up to the timeout.
+
+        Other threads are not blocked while waiting.
+
+        :param float timeout: Maximum number of seconds to wait
+        :returns: Input event or None if timeout has passed.
+        :rtype: Optional[NcInput]
+        """
+        with self._input_lock:
+            nc_input = _notcurses_context_get_input(
+                self._nc_context, timeout)
+
+        return NcInput(nc_input) if nc_input is not None else None
+
+    def drain_input(self, max_events: int = 1024) -> NcInputBatch:
+        """
+        Reads all pending input events at once without waiting.
+
+        Events are stored in arrays instead of separate
+        :py:class:`NcInput` objects which is much faster
+        for bursts of mouse events.
+
+        :param int max_events: Maximum number of events to read
+        :returns: Batch of events, empty if there is no pending input.
+        :rtype: NcInputBatch
+        """
+        with self._input_lock:
+            return NcInputBatch(
+                *_notcurses_context_drain_input(self._nc_context, max_events)
+            )
+
+    @property
+    def input_fd(self) -> int:
+        """
+        File descriptor that becomes readable when input is pending
+
+        Can be used with :py:mod:`selectors` or an event loop.
+
+        :rtype: int
+        """
+        return _notcurses_context_get_input_fd(self._nc_context)
+
+    async def events(self) -> AsyncIterator[NcInput]:
+        """
+        Asynchronously iterates over :py:class:`NcInput` events.
+
+        Input file descriptor is registered with the running event loop
+        so no threads are used. Usage::
+
+            async for nc_input in context.events():
+                ...
+        """
+        from asyncio import Event, get_running_loop
+
+        loop = get_running_loop()
+        input_ready = Event()
+        input_fd = self.input_fd
+        loop.add_reader(input_fd, input_ready.set)
+        try:
+            while True:
+                nc_input = self.get_input_nonblocking()
+                if nc_input is not None:
+                    yield nc_input
+                    continue
+
+                input_ready.clear()
+                await input_ready.wait()
+        finally:
+            loop.remove_reader(input_fd)
+
+    async def render_async(self) -> None:
+        """
+        Renders from the event loop.
+
+        All calls made before the frame is rendered are coalesced
+        into one :py:meth:`render`. The frame is delayed by the
+        :py:attr:`max_fps` limit.
+        """
+        from asyncio import get_running_loop, shield
+
+        if self._render_future is None:
+            loop = get_running_loop()
+            self._render_future = loop.create_future()
+            loop.call_later(self.time_until_render() or 0.0,
+                            self._render_scheduled)
+
+        await shield(self._render_future)
+
+    def _render_scheduled(self) -> None:
+        render_future = self._render_future
+        self._render_future = None
+        if render_future is None:
+            return
+
+        if not self._has_started:
+            # Stopped while the frame was delayed
+            render_future.set_result(None)
+            return
+
+        try:
+            self.render()
+        except Exception as e:
+            render_future.set_exception(e)
+        else:
+            render_future.set_result(None)
 
     def enable_mouse(self) -> None:
         """Enables mouse on the terminal"""
@@ -136,6 +497,159 @@ class NotcursesContext:
             self.stop()
 
 
+class NcStats:
+    """
+    Rendering statistics returned by :py:meth:`NotcursesContext.stats`
+    """
+
+    def __init__(self, nc_stats: _NcStats):
+        self._nc_stats = nc_stats
+
+    @property
+    def renders(self) -> int:
+        """
+        Number of successful renders
+
+        :rtype: int
+        """
+        return self._nc_stats.renders
+
+    @property
+    def failed_renders(self) -> int:
+        """
+        Number of failed renders
+
+        :rtype: int
+        """
+        return self._nc_stats.failed_renders
+
+    @property
+    def render_bytes(self) -> int:
+        """
+        Total bytes written to the terminal
+
+        :rtype: int
+        """
+        return self._nc_stats.render_bytes
+
+    @property
+    def render_max_bytes(self) -> int:
+        """
+        Maximum bytes written in a single frame
+
+        :rtype: int
+        """
+        return self._nc_stats.render_max_bytes
+
+    @property
+    def render_min_bytes(self) -> int:
+        """
+        Minimum bytes written in a single frame
+
+        :rtype: int
+        """
+        return self._nc_stats.render_min_bytes
+
+    @property
+    def render_ns(self) -> int:
+        """
+        Total nanoseconds spent rendering
+
+        :rtype: int
+        """
+        return self._nc_stats.render_ns
+
+    @property
+    def render_max_ns(self) -> int:
+        """
+        Maximum nanoseconds spent rendering a frame
+
+        :rtype: int
+        """
+        return self._nc_stats.render_max_ns
+
+    @property
+    def render_min_ns(self) -> int:
+        """
+        Minimum nanoseconds spent rendering a frame
+
+        :rtype: int
+        """
+        return self._nc_stats.render_min_ns
+
+    @property
+    def cell_elisions(self) -> int:
+        """
+        Number of cells not written because they were unchanged
+
+        :rtype: int
+        """
+        return self._nc_stats.cell_elisions
+
+    @property
+    def cell_emissions(self) -> int:
+        """
+        Number of cells written to the terminal
+
+        :rtype: int
+        """
+        return self._nc_stats.cell_emissions
+
+    @property
+    def fg_elisions(self) -> int:
+        """
+        Number of foreground color changes elided
+
+        :rtype: int
+        """
+        return self._nc_stats.fg_elisions
+
+    @property
+    def fg_emissions(self) -> int:
+        """
+        Number of foreground color changes written
+
+        :rtype: int
+        """
+        return self._nc_stats.fg_emissions
+
+    @property
+    def bg_elisions(self) -> int:
+        """
+        Number of background color changes elided
+
+        :rtype: int
+        """
+        return self._nc_stats.bg_elisions
+
+    @property
+    def bg_emissions(self) -> int:
+        """
+        Number of background color changes written
+
+        :rtype: int
+        """
+        return self._nc_stats.bg_emissions
+
+    @property
+    def framebuffer_bytes(self) -> int:
+        """
+        Bytes used by all framebuffers
+
+        :rtype: int
+        """
+        return self._nc_stats.framebuffer_bytes
+
+    @property
+    def planes(self) -> int:
+        """
+        Number of planes in existence
+
+        :rtype: int
+        """
+        return self._nc_stats.planes
+
+
 class NcInput:
     """Represents an input event"""
 
@@ -155,7 +669,7 @@ class NcInput:
         :rtype: Union[str, NcInputCodes]
         """
         try:
-            return NC_INPUT_CODES[self._nc_input.codepoint]
+            return _get_nc_input_codes_map()[self._nc_input.codepoint]
         except KeyError:
             return chr(self._nc_input.codepoint)
 
@@ -214,17 +728,93 @@ class NcInput:
         return self._nc_input.seqnum
 
 
+class NcInputBatch:
+    """
+    Input events read by :py:meth:`NotcursesContext.drain_input`
+
+    Each attribute is a :py:class:`memoryview` with one item per event.
+    Event `i` is made of `codepoints[i]`, `y_positions[i]`,
+    `x_positions[i]`, `modifiers[i]` and `seqnums[i]`.
+
+    :cvar int MODIFIER_ALT: Bit set in `modifiers` if Alt was pressed
+    :cvar int MODIFIER_SHIFT: Bit set in `modifiers` if Shift was pressed
+    :cvar int MODIFIER_CTRL: Bit set in `modifiers` if Ctrl was pressed
+    :ivar memoryview codepoints: Codepoints (unsigned 32-bit)
+    :ivar memoryview y_positions: Y positions (signed 32-bit)
+    :ivar memoryview x_positions: X positions (signed 32-bit)
+    :ivar memoryview modifiers: Modifier bits (unsigned 8-bit)
+    :ivar memoryview seqnums: Sequence numbers (unsigned 64-bit)
+    """
+    MODIFIER_ALT = _notcurses.NCINPUT_MODIFIER_ALT
+    MODIFIER_SHIFT = _notcurses.NCINPUT_MODIFIER_SHIFT
+    MODIFIER_CTRL = _notcurses.NCINPUT_MODIFIER_CTRL
+
+    def __init__(self,
+                 codepoints: bytes, y_positions: bytes, x_positions: bytes,
+                 modifiers: bytes, seqnums: bytes):
+        self.codepoints = memoryview(codepoints).cast('I')
+        self.y_positions = memoryview(y_positions).cast('i')
+        self.x_positions = memoryview(x_positions).cast('i')
+        self.modifiers = memoryview(modifiers).cast('B')
+        self.seqnums = memoryview(seqnums).cast('Q')
+
+    def __len__(self) -> int:
+        return len(self.codepoints)
+
+
 class NcPlane:
     """Class representing a drawing surface"""
 
-    def __init__(self, plane: _NcPlane, context: NotcursesContext) -> None:
+    def __init__(
+            self, plane: _NcPlane, context: NotcursesContext,
+            parent: Optional[NcPlane] = None) -> None:
         """
         NcPlane should not be initialized directly by user.
         Use :py:meth:`NcPlane.create_sub_plane` to create sub planes from the
         standard plane
+
+        Sub planes are destroyed when they get garbage collected.
+        Sub plane keeps its parent alive.
         """
         self._nc_plane = plane
         self.context = context
+        self._parent = parent
+        self._children: WeakSet[NcPlane] = WeakSet()
+        if parent is not None:
+            parent._children.add(self)
+        self._hidden_position_yx: Optional[Tuple[int, int]] = None
+
+    def __enter__(self) -> NcPlane:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType]) -> None:
+        self.destroy()
+
+    def destroy(self) -> None:
+        """
+        Destroys the plane and all of its sub planes
+
+        Plane can not be used after it was destroyed.
+        Sub planes are also destroyed when they get garbage collected,
+        before the next render.
+        This method destroys them right away.
+        Standard plane can not be destroyed.
+
+        Holds :py:attr:`NotcursesContext.lock` while destroying.
+        """
+        if self._parent is None:
+            raise RuntimeError('Standard plane can not be destroyed')
+
+        with self.context.lock:
+            for child in list(self._children):
+                child.destroy()
+
+            self.context.mark_dirty()
+            _nc_plane_destroy(self._nc_plane)
 
     @property
     def dimensions_yx(self) -> Tuple[int, int]:
@@ -238,7 +828,8 @@ class NcPlane:
     def putstr(
             self,
             string: str,
-            y_pos: int = -1, x_pos: int = -1) -> int:
+            y_pos: int = -1, x_pos: int = -1,
+            nc_channels: Optional[NcChannels] = None) -> int:
         """
         Puts a string on the plane
 
@@ -247,15 +838,53 @@ class NcPlane:
             By default is the cursor position.
         :param int x_pos: X position to put string.
             By default is the cursor position.
+        :param Optional[NcChannels] nc_channels: Colors of the string.
+            By default the plane colors are used.
+            Plane colors are not changed.
         :returns: Number of characters written.
             Negative if some characters could not be written.
         :rtype: int
         """
+        self.context.mark_dirty()
         return _nc_plane_putstr(
             self._nc_plane,
             string,
             y_pos,
             x_pos,
+            nc_channels._nc_channels
+            if nc_channels is not None else nc_channels,
+        )
+
+    def put_runs(
+            self,
+            runs: Iterable[Tuple[str, Optional[NcChannels]]],
+            y_pos: int = -1, x_pos: int = -1) -> int:
+        """
+        Puts strings with their own colors one after another
+
+        Useful for syntax highlighted lines made of many short runs.
+        All runs are put in a single call. Plane colors are not changed.
+
+        :param runs: Pairs of string and colors it will use.
+            None colors means the plane colors.
+        :type runs: Iterable[Tuple[str, Optional[NcChannels]]]
+        :param int y_pos: Y position of the first run.
+            By default is the cursor position.
+        :param int x_pos: X position of the first run.
+            By default is the cursor position.
+        :returns: Number of characters written.
+            Negative if some characters could not be written.
+        :rtype: int
+        """
+        self.context.mark_dirty()
+        return _nc_plane_put_runs(
+            self._nc_plane,
+            [(string,
+              nc_channels._nc_channels
+              if nc_channels is not None else nc_channels)
+             for string, nc_channels in runs],
+            y_pos,
+            x_pos,
         )
 
     def putstr_aligned(self,
@@ -274,6 +903,7 @@ class NcPlane:
             Negative if some characters could not be written.
         :rtype: int
         """
+        self.context.mark_dirty()
         return _nc_plane_putstr_aligned(
             self._nc_plane,
             string,
@@ -282,33 +912,226 @@ class NcPlane:
         )
 
     def put_lines(
-        self, lines_iter: Iterable[str], wrap_lines: bool = False
-    ) -> None:
+        self, lines_iter: Iterable[str], wrap_lines: bool = False,
+        y_pos: int = 0,
+    ) -> int:
         """
         Puts string from the iterator on the plane.
         Each string is put on a new line.
 
+        Lines are taken from the iterator only while there is space
+        left on the plane so it is safe to pass endless generators.
+
         :param iter[str] lines_iter: Iterator of lines to put on the plane
         :param bool wrap_lines: If line is longer that the surface
             should it be continued on the next line? Default false.
+        :param int y_pos: Y position of the first line
+        :returns: Number of lines taken from the iterator
+        :rtype: int
         """
-        y_pos = 0
-
-        for line in lines_iter:
-            # TODO: needs to stop if we are outside the plane
-            chars_put = self.putstr(line, y_pos, 0)
-            y_pos += 1
+        self.context.mark_dirty()
+        return _nc_plane_put_lines(
+            self._nc_plane,
+            lines_iter,
+            y_pos,
+            wrap_lines,
+        )
 
-            if not wrap_lines:
-                continue
+    def blit_cells(
+        self,
+        chars: object,
+        foreground: Optional[object] = None,
+        background: Optional[object] = None,
+        y_pos: int = 0, x_pos: int = 0,
+        cols_num: Optional[int] = None,
+    ) -> int:
+        """
+        Puts a whole grid of cells on the plane in a single call
+
+        The grid is given as objects supporting buffer protocol
+        of 32-bit integers in row major order, for example
+        `array('I')`, `memoryview` or NumPy `uint32` arrays.
+        Cells outside the plane are skipped.
+        Cells covered by a wide character on their left are skipped.
+        Plane colors are not changed.
+        Holds :py:attr:`NotcursesContext.lock` while writing.
+
+        :param chars: Unicode codepoint of each cell
+        :param foreground: Foreground color of each cell packed as
+            0xRRGGBB. If None the current plane color is used.
+        :param background: Background color of each cell packed as
+            0xRRGGBB. If None the current plane color is used.
+        :param int y_pos: Y position of the top left cell
+        :param int x_pos: X position of the top left cell
+        :param Optional[int] cols_num: Number of columns in grid.
+            By default is the second dimension of a two dimensional
+            `chars` buffer or the plane width.
+        :returns: Number of cells written.
+        :rtype: int
+        """
+        if cols_num is None:
+            chars_shape = memoryview(chars).shape  # type: ignore
+            if chars_shape is not None and len(chars_shape) == 2:
+                cols_num = chars_shape[1]
+            else:
+                _, x_dim = self.dimensions_yx
+                cols_num = x_dim - x_pos
+
+        self.context.mark_dirty()
+        with self.context.lock:
+            return _nc_plane_blit_cells(
+                self._nc_plane,
+                chars, foreground, background,
+                y_pos, x_pos, cols_num,
+            )
+
+    def snapshot(
+        self,
+        y_pos: int = 0,
+        x_pos: int = 0,
+        rows_num: Optional[int] = None,
+        cols_num: Optional[int] = None,
+    ) -> NcPlaneSnapshot:
+        """
+        Reads back the content of the plane region
+
+        Holds :py:attr:`NotcursesContext.lock` while reading.
+
+        :param int y_pos: Y position of the top left cell
+        :param int x_pos: X position of the top left cell
+        :param Optional[int] rows_num: Number of rows.
+            By default to the bottom of the plane.
+        :param Optional[int] cols_num: Number of columns.
+            By default to the right edge of the plane.
+        :returns: Glyphs and channels of the cells
+        :rtype: NcPlaneSnapshot
+        """
+        y_dim, x_dim = self.dimensions_yx
+        if rows_num is None:
+            rows_num = max(0, y_dim - y_pos)
+        if cols_num is None:
+            cols_num = max(0, x_dim - x_pos)
 
-            while chars_put < 0:
-                line = line[abs(chars_put):]
-                chars_put = self.putstr(line, y_pos, 0)
-                y_pos += 1
+        with self.context.lock:
+            glyphs, channels = _nc_plane_snapshot(
+                self._nc_plane, y_pos, x_pos, rows_num, cols_num)
+        return NcPlaneSnapshot(glyphs, channels, rows_num, cols_num)
+
+    def blit_rgba(
+        self,
+        rgba_buffer: object,
+        rows_num: int, cols_num: int,
+        row_stride: Optional[int] = None,
+        scale: NcScale = NcScale.NONE,
+        y_pos: int = 0, x_pos: int = 0,
+    ) -> None:
+        """
+        Draws an RGBA image on the plane
+
+        The pixels are read directly from any object supporting
+        buffer protocol, for example `bytes`, `bytearray`, `mmap`
+        or NumPy `uint8` arrays.
+        Holds :py:attr:`NotcursesContext.lock` while drawing.
+
+        :param rgba_buffer: Pixels as 4 bytes each (red, green, blue, alpha)
+        :param int rows_num: Number of pixel rows in image
+        :param int cols_num: Number of pixel columns in image
+        :param Optional[int] row_stride: Number of bytes between
+            the starts of two rows. By default rows are packed.
+        :param NcScale scale: How to scale image to the plane
+        :param int y_pos: Y position of the image on the plane
+        :param int x_pos: X position of the image on the plane
+        """
+        if row_stride is None:
+            row_stride = cols_num * 4
+
+        self.context.mark_dirty()
+        with self.context.lock:
+            _nc_plane_blit_rgba(
+                self._nc_plane,
+                rgba_buffer,
+                rows_num, cols_num, row_stride,
+                scale, y_pos, x_pos,
+            )
+
+    def hbar(
+            self, value: float, width: int,
+            from_rgb: Tuple[int, int, int], to_rgb: Tuple[int, int, int],
+            y_pos: int = -1, x_pos: int = -1,
+            fill: str = ' ') -> int:
+        """
+        Puts a horizontal bar with a color gradient.
+
+        The colors of the blocks are computed in C.
+        A bar of full width goes from `from_rgb` to `to_rgb`,
+        a shorter bar stops partway.
+        Plane colors are not changed.
+
+        :param float value: How much of the bar to fill from 0.0 to 1.0
+        :param int width: Width of the full bar in columns
+        :param Tuple[int,int,int] from_rgb: Color of the first block
+        :param Tuple[int,int,int] to_rgb: Color at the end of full bar
+        :param int y_pos: Y position of the bar.
+            By default is the cursor position.
+        :param int x_pos: X position of the bar.
+            By default is the cursor position.
+        :param str fill: Character of each block
+        :returns: Number of blocks written
+        :rtype: int
+        """
+        self.context.mark_dirty()
+        return _nc_plane_hbar(
+            self._nc_plane,
+            y_pos, x_pos,
+            value, width, from_rgb, to_rgb, fill,
+        )
+
+    def gradient_fill(
+            self,
+            top_left: Tuple[int, int, int],
+            top_right: Tuple[int, int, int],
+            bottom_left: Tuple[int, int, int],
+            bottom_right: Tuple[int, int, int],
+            y_pos: int = 0, x_pos: int = 0,
+            rows_num: Optional[int] = None,
+            cols_num: Optional[int] = None,
+            fill: str = ' ') -> int:
+        """
+        Fills a rectangle with colors interpolated between its corners.
+
+        :param Tuple[int,int,int] top_left: Color of top left corner
+        :param Tuple[int,int,int] top_right: Color of top right corner
+        :param Tuple[int,int,int] bottom_left: Color of bottom left corner
+        :param Tuple[int,int,int] bottom_right: Color of bottom right corner
+        :param int y_pos: Y position of top left corner
+        :param int x_pos: X position of top left corner
+        :param Optional[int] rows_num: Number of rows.
+            By default fills until the bottom of the plane.
+        :param Optional[int] cols_num: Number of columns.
+            By default fills until the right side of the plane.
+        :param str fill: Character of each cell
+        :returns: Number of cells filled
+        :rtype: int
+        """
+        y_dim, x_dim = self.dimensions_yx
+        if rows_num is None:
+            rows_num = y_dim - y_pos
+
+        if cols_num is None:
+            cols_num = x_dim - x_pos
+
+        self.context.mark_dirty()
+        return _nc_plane_gradient(
+            self._nc_plane,
+            fill,
+            top_left, top_right, bottom_left, bottom_right,
+            y_pos, x_pos,
+            y_pos + rows_num - 1, x_pos + cols_num - 1,
+        )
 
     def erase(self) -> None:
         """Remove all symbols from plane"""
+        self.context.mark_dirty()
         return _nc_plane_erase(self._nc_plane)
 
     def set_background_rgb(
@@ -333,6 +1156,121 @@ class NcPlane:
         """
         _nc_plane_set_foreground_rgb(self._nc_plane, red, green, blue)
 
+    @property
+    def position_yx(self) -> Tuple[int, int]:
+        """
+        Returns Y and X position of the plane
+
+        :rtype: Tuple[int, int]
+        """
+        if self._hidden_position_yx is not None:
+            return self._hidden_position_yx
+
+        return _nc_plane_yx(self._nc_plane)
+
+    def move_yx(self, y_pos: int, x_pos: int) -> None:
+        """
+        Moves plane to the new position
+
+        Moving a plane is much cheaper than drawing it again.
+        Hidden plane will appear at this position when shown.
+
+        :param int y_pos: New Y position
+        :param int x_pos: New X position
+        """
+        if self._hidden_position_yx is not None:
+            self._hidden_position_yx = (y_pos, x_pos)
+            return
+
+        self.context.mark_dirty()
+        _nc_plane_move_yx(self._nc_plane, y_pos, x_pos)
+
+    def resize(self, rows_num: int, cols_num: int) -> None:
+        """
+        Changes plane size keeping the top left corner in place
+
+        Content that still fits the plane is kept.
+
+        :param int rows_num: New number of rows (i.e. Y size)
+        :param int cols_num: New number of columns (i.e. X size)
+        """
+        self.context.mark_dirty()
+        _nc_plane_resize_simple(self._nc_plane, rows_num, cols_num)
+
+    def reparent(self, new_parent: NcPlane) -> None:
+        """
+        Makes plane a sub plane of another plane
+
+        Sub planes of this plane move together with it.
+
+        :param NcPlane new_parent: New parent plane
+        """
+        self.context.mark_dirty()
+        _nc_plane_reparent(self._nc_plane, new_parent._nc_plane)
+        if self._parent is not None:
+            self._parent._children.discard(self)
+        self._parent = new_parent
+        new_parent._children.add(self)
+
+    def move_top(self) -> None:
+        """Puts plane above all other planes."""
+        self.context.mark_dirty()
+        _nc_plane_move_top(self._nc_plane)
+
+    def move_bottom(self) -> None:
+        """Puts plane below all other planes."""
+        self.context.mark_dirty()
+        _nc_plane_move_bottom(self._nc_plane)
+
+    def move_above(self, other_plane: NcPlane) -> None:
+        """
+        Puts plane right above the other plane
+
+        :param NcPlane other_plane: Plane that will be below
+        """
+        self.context.mark_dirty()
+        _nc_plane_move_above(self._nc_plane, other_plane._nc_plane)
+
+    def move_below(self, other_plane: NcPlane) -> None:
+        """
+        Puts plane right below the other plane
+
+        :param NcPlane other_plane: Plane that will be above
+        """
+        self.context.mark_dirty()
+        _nc_plane_move_below(self._nc_plane, other_plane._nc_plane)
+
+    @property
+    def is_visible(self) -> bool:
+        """
+        Is plane shown or was hidden with :py:meth:`hide`
+
+        :rtype: bool
+        """
+        return self._hidden_position_yx is None
+
+    def hide(self) -> None:
+        """
+        Hides plane without losing its content
+
+        Plane is moved out of the screen and its position is remembered.
+        """
+        if self._hidden_position_yx is not None:
+            return
+
+        self._hidden_position_yx = _nc_plane_yx(self._nc_plane)
+        self.context.mark_dirty()
+        _nc_plane_move_yx(self._nc_plane, _OFF_SCREEN_POS, _OFF_SCREEN_POS)
+
+    def show(self) -> None:
+        """Shows plane hidden with :py:meth:`hide` at its position."""
+        if self._hidden_position_yx is None:
+            return
+
+        y_pos, x_pos = self._hidden_position_yx
+        self._hidden_position_yx = None
+        self.move_yx(y_pos, x_pos)
+
     def create_sub_plane(
         self,
         y_pos: int = 0,
@@ -368,267 +1306,611 @@ class NcPlane:
             y_pos, x_pos, rows_num, cols_num
         )
 
-        return NcPlane(new_plane, self.context)
+        return NcPlane(new_plane, self.context, self)
 
 
-_default_context: Optional[NotcursesContext] = None
+class NcPlaneSnapshot:
+    """
+    Content of plane region returned by :py:meth:`NcPlane.snapshot`
 
+    Cells are stored in row major order without a Python object per cell.
 
-def get_std_plane() -> NcPlane:
+    :ivar memoryview glyphs: Unicode codepoint of each cell.
+        Only the first codepoint of a grapheme cluster is kept.
+        0 if the cell is empty or outside of the plane.
+    :ivar memoryview channels: Channels of each cell as 64-bit integers
+    :ivar int rows_num: Number of rows
+    :ivar int cols_num: Number of columns
     """
-    Initializes context and returns the standard plane.
 
-    .. warning::
-        The terminal will be acquired by notcurses and uncontrollable until
-        the standard plane will be dereferenced.
+    def __init__(
+            self, glyphs: bytes, channels: bytes,
+            rows_num: int, cols_num: int) -> None:
+        self.glyphs = memoryview(glyphs).cast('I')
+        self.channels = memoryview(channels).cast('Q')
+        self.rows_num = rows_num
+        self.cols_num = cols_num
 
-    :return: Standard plane of the terminal
-    :rtype: NcPlane
+    def line(self, row: int) -> str:
+        """
+        Returns text of the row
+
+        Empty cells are returned as spaces.
+
+        :param int row: Row index
+        :rtype: str
+        """
+        start = row * self.cols_num
+        return ''.join(
+            chr(glyph) if glyph else ' '
+            for glyph in self.glyphs[start:start + self.cols_num]
+        )
+
+    def lines(self) -> Iterator[str]:
+        """
+        Iterates over text of every row
+
+        :rtype: Iterator[str]
+        """
+        for row in range(self.rows_num):
+            yield self.line(row)
+
+
+class NcShadowPlane:
+    """
+    Grid of cells that sends only changed cells to the plane
+
+    Draw the frame in to :py:attr:`chars`, :py:attr:`foreground` and
+    :py:attr:`background` and call :py:meth:`flush`. The frame is
+    compared with the previously flushed one and only the changed
+    runs of cells are written to the plane.
+
+    :ivar array chars: Unicode codepoint of each cell in row major order
+    :ivar Optional[array] foreground: Foreground color of each cell
+        packed as 0xRRGGBB. None if the plane color is used.
+    :ivar Optional[array] background: Background color of each cell
+        packed as 0xRRGGBB. None if the plane color is used.
     """
-    global _default_context
-    if _default_context is None:
-        _default_context = NotcursesContext()
 
-    std_plane_ref = _notcurses_context_get_std_plane(
-        _default_context._nc_context)
-    return NcPlane(std_plane_ref, _default_context)
+    def __init__(
+        self,
+        plane: NcPlane,
+        y_pos: int = 0,
+        x_pos: int = 0,
+        rows_num: Optional[int] = None,
+        cols_num: Optional[int] = None,
+        use_colors: bool = True,
+    ) -> None:
+        """
+        Creates shadow grid over the region of plane
+
+        :param NcPlane plane: Plane to draw on
+        :param int y_pos: Y position of the top left cell
+        :param int x_pos: X position of the top left cell
+        :param Optional[int] rows_num: Number of rows.
+            By default to the bottom of the plane.
+        :param Optional[int] cols_num: Number of columns.
+            By default to the right edge of the plane.
+        :param bool use_colors: Keep the color of each cell.
+            If False the plane colors are used.
+        """
+        y_dim, x_dim = plane.dimensions_yx
+        self.plane = plane
+        self.y_pos = y_pos
+        self.x_pos = x_pos
+        self.rows_num = rows_num if rows_num is not None else y_dim - y_pos
+        self.cols_num = cols_num if cols_num is not None else x_dim - x_pos
+
+        cells_num = self.rows_num * self.cols_num
+        self.chars = array('I', [ord(' ')]) * cells_num
+        self.foreground: Optional[array[int]] = None
+        self.background: Optional[array[int]] = None
+        self._prev_foreground: Optional[array[int]] = None
+        self._prev_background: Optional[array[int]] = None
+        if use_colors:
+            self.foreground = array('I', [0xffffff]) * cells_num
+            self.background = array('I', [0x000000]) * cells_num
+            self._prev_foreground = array('I', [0]) * cells_num
+            self._prev_background = array('I', [0]) * cells_num
+        self._prev_chars = array('I', [0]) * cells_num
+        self.invalidate()
+
+    def put_line(
+            self, row: int, col: int, line: str,
+            foreground: Optional[int] = None,
+            background: Optional[int] = None) -> None:
+        """
+        Puts a line in to the grid
+
+        Characters past the right edge are cut off.
+        Raises IndexError if the row or column is outside of the grid.
+
+        :param int row: Row of the first character
+        :param int col: Column of the first character
+        :param str line: Characters to put
+        :param Optional[int] foreground: Foreground color 0xRRGGBB.
+            None keeps the current colors of the cells.
+        :param Optional[int] background: Background color 0xRRGGBB.
+            None keeps the current colors of the cells.
+        """
+        if not 0 <= row < self.rows_num or col < 0:
+            raise IndexError('Position is outside of the grid')
+
+        line = line[:max(0, self.cols_num - col)]
+        start = row * self.cols_num + col
+        end = start + len(line)
+        self.chars[start:end] = array('I', map(ord, line))
+        if foreground is not None and self.foreground is not None:
+            self.foreground[start:end] = array('I', [foreground]) * len(line)
+        if background is not None and self.background is not None:
+            self.background[start:end] = array('I', [background]) * len(line)
+
+    def clear(
+            self,
+            foreground: int = 0xffffff,
+            background: int = 0x000000) -> None:
+        """
+        Fills the grid with spaces
+
+        :param int foreground: Foreground color 0xRRGGBB
+        :param int background: Background color 0xRRGGBB
+        """
+        cells_num = len(self.chars)
+        self.chars[:] = array('I', [ord(' ')]) * cells_num
+        if self.foreground is not None:
+            self.foreground[:] = array('I', [foreground]) * cells_num
+        if self.background is not None:
+            self.background[:] = array('I', [background]) * cells_num
+
+    def invalidate(self) -> None:
+        """
+        Forgets the previous frame so the next flush writes every cell
+
+        Call it after the plane was changed other way,
+        for example with :py:meth:`NcPlane.erase`.
+        """
+        # No valid codepoint is equal to it
+        self._prev_chars[:] = array('I', [0xffffffff]) * len(self._prev_chars)
+
+    def flush(self) -> int:
+        """
+        Writes cells that changed since the last flush to the plane
 
+        Holds :py:attr:`NotcursesContext.lock` while writing.
 
-class NcChannels:
+        :returns: Number of cells written.
+        :rtype: int
+        """
+        with self.plane.context.lock:
+            cells_written = _nc_plane_blit_cells_diff(
+                self.plane._nc_plane,
+                self.chars, self.foreground, self.background,
+                self._prev_chars, self._prev_foreground,
+                self._prev_background,
+                self.y_pos, self.x_pos, self.rows_num, self.cols_num,
+            )
+        if cells_written:
+            self.plane.context.mark_dirty()
+        return cells_written
+
+
+class NcPlanePool:
     """
-    Class that hold the colors and transparency values
+    Pool of sub planes that are reused instead of created again
 
-    Can be used in some functions instead of directly specifying colors.
+    Released planes are erased and moved out of the screen.
+    A plane of the requested size is reused first, otherwise
+    an idle plane of different size is resized.
     """
 
-    def __init__(self) -> None:
-        self._nc_channels = _NcChannels()
+    def __init__(self, parent: NcPlane, max_idle: int = 16) -> None:
+        """
+        Creates pool of sub planes of parent plane
 
-    def set_background_rgb(self, red: int, green: int, blue: int) -> None:
+        :param NcPlane parent: Parent plane of all planes in the pool
+        :param int max_idle: Maximum number of released planes kept
+            for reuse. Planes released over it are destroyed.
         """
-        Sets the background color
+        self.parent = parent
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[int, int], List[NcPlane]] = {}
+        self._idle_count = 0
 
-        :param int red: Red color component given as integer from 0 to 255
-        :param int green: Green color component given as integer from 0 to 255
-        :param int blue: Blue color component given as integer from 0 to 255
+    @property
+    def idle_count(self) -> int:
         """
-        _nc_channels_set_background_rgb(
-            self._nc_channels,
-            red, green, blue,
-        )
+        Number of released planes waiting for reuse
 
-    def set_foreground_rgb(self, red: int, green: int, blue: int) -> None:
+        :rtype: int
         """
-        Sets the foreground color
+        return self._idle_count
 
-        :param int red: Red color component given as integer from 0 to 255
-        :param int green: Green color component given as integer from 0 to 255
-        :param int blue: Blue color component given as integer from 0 to 255
+    def acquire(
+        self,
+        y_pos: int,
+        x_pos: int,
+        rows_num: int,
+        cols_num: int,
+    ) -> NcPlane:
         """
-        _nc_channels_set_foreground_rgb(
-            self._nc_channels,
-            red, green, blue,
-        )
+        Gets a sub plane from the pool or creates a new one
 
+        :param int y_pos: top left corner Y coordinate
+            relative to top left corner of parent
+        :param int x_pos: top left corner X coordinate
+            relative to top left corner of parent
+        :param int rows_num: Number of rows (i.e. Y size)
+        :param int cols_num: Number of columns (i.e. X size)
+        :returns: Empty plane of requested size and position
+        :rtype: NcPlane
+        """
+        size = (rows_num, cols_num)
+        if size not in self._idle:
+            if not self._idle:
+                return self.parent.create_sub_plane(
+                    y_pos, x_pos, rows_num, cols_num)
+
+            size = next(iter(self._idle))
+
+        idle_planes = self._idle[size]
+        plane = idle_planes.pop()
+        if not idle_planes:
+            del self._idle[size]
+        self._idle_count -= 1
+
+        if size != (rows_num, cols_num):
+            plane.resize(rows_num, cols_num)
+        plane.move_yx(y_pos, x_pos)
+        plane.show()
+        return plane
+
+    def release(self, plane: NcPlane) -> None:
+        """
+        Returns plane acquired from this pool
 
-class NcDirect:
+        Plane should not be used after it was released.
+
+        :param NcPlane plane: Plane to return
+        """
+        if self._idle_count >= self.max_idle:
+            plane.destroy()
+            return
+
+        plane.erase()
+        plane.hide()
+        rows_num, cols_num = plane.dimensions_yx
+        self._idle.setdefault((rows_num, cols_num), []).append(plane)
+        self._idle_count += 1
+
+    def clear(self) -> None:
+        """Destroys all idle planes."""
+        for idle_planes in self._idle.values():
+            for plane in idle_planes:
+                plane.destroy()
+
+        self._idle.clear()
+        self._idle_count = 0
+
+
+class NcScrollingPlane:
     """
-    NcDirect is a subset of Notcurses.
-    It does not clear entire terminal but instead draws on to normal
-    terminal surface. That means the output is preserved after the application
-    has exited and can be scrolled back.
+    Plane that shows a stream of lines such as a log
+
+    New lines are added at the bottom and the older lines scroll up.
+    Scrolling is done by notcurses so only the new line is drawn.
+    A bounded backlog of lines is kept to scroll back through.
 
-    NcDirect has only one main plane.
+    :ivar NcPlane plane: Sub plane the lines are drawn on
     """
 
-    def __init__(self,
-                 start_immediately: bool = True):
+    def __init__(
+        self,
+        parent: NcPlane,
+        y_pos: int = 0,
+        x_pos: int = 0,
+        rows_num: Optional[int] = None,
+        cols_num: Optional[int] = None,
+        backlog_size: int = 10000,
+    ) -> None:
         """
-        Create the main direct plane.
+        Creates a scrolling sub plane of parent plane
 
-        :param bool start_immediately: Whether or not to start NcDirect on
-            initialization.
+        :param NcPlane parent: Parent plane
+        :param int y_pos: top left corner Y coordinate
+            relative to top left corner of parent
+        :param int x_pos: top left corner X coordinate
+            relative to top left corner of parent
+        :param int rows_num: Number of rows (i.e. Y size)
+        :param int cols_num: Number of columns (i.e. X size)
+        :param int backlog_size: Maximum number of lines remembered
         """
-        self._nc_direct = _NcDirect()
-        self._is_cursor_enabled: Optional[bool] = None
-        self._has_started = False
-        if start_immediately:
-            self.start()
+        self.plane = parent.create_sub_plane(
+            y_pos, x_pos, rows_num, cols_num)
+        _nc_plane_set_scrolling(self.plane._nc_plane, True)
+        self._backlog: Deque[str] = deque(maxlen=backlog_size)
+        self._scroll_offset = 0
+        # Rows used from the top before the plane starts scrolling
+        self._rows_drawn = 0
 
-    def __del__(self) -> None:
-        if self._has_started:
-            self.stop()
+    @property
+    def scroll_offset(self) -> int:
+        """
+        Number of lines the view is scrolled back from the newest line
 
-    def start(self) -> None:
+        :rtype: int
         """
-        Start NcDirect.
+        return self._scroll_offset
+
+    def __len__(self) -> int:
+        return len(self._backlog)
+
+    def append_line(self, line: str) -> None:
         """
-        _nc_direct_init(self._nc_direct)
-        self._has_started = True
+        Adds a line at the bottom.
 
-    def stop(self) -> None:
+        If the view is scrolled back it stays on the same lines.
+        Lines wider than the plane are clipped to its width.
+
+        :param str line: Line to add
         """
-        Stop NcDirect
+        self._backlog.append(line)
+        if self._scroll_offset:
+            self._scroll_offset = min(self._scroll_offset + 1,
+                                      self._max_scroll_offset())
+            return
+
+        # Lines are put at explicit rows because a line of full width
+        # leaves the cursor at the edge instead of the next row
+        rows_num, cols_num = self.plane.dimensions_yx
+        line = line[:cols_num]
+        if self._rows_drawn < rows_num:
+            self.plane.putstr(line, self._rows_drawn, 0)
+            self._rows_drawn += 1
+        else:
+            self.plane.putstr('\n' + line, rows_num - 1, 0)
 
-        Will be automatically called if NcDirect object gets garbage collected
+    def extend(self, lines: Iterable[str]) -> None:
         """
-        _nc_direct_stop(self._nc_direct)
+        Adds many lines at the bottom.
 
-    def putstr(
-            self, string: str,
-            nc_channels: Optional[NcChannels] = None) -> int:
+        :param iter[str] lines: Lines to add
         """
-        Puts a string on the plane.
-        This will immediately take effect. There is not `render` function for
-        NcDirect.
+        for line in lines:
+            self.append_line(line)
 
-        :param Optional[NcChannels] nc_channels: The colors string will use
-        :returns: Number of characters written.
-            Negative if some characters could not be written.
-        :rtype: int
+    def scroll_up(self, lines_num: int = 1) -> None:
         """
+        Scrolls the view back to older lines.
 
-        return _nc_direct_putstr(
-            self._nc_direct,
-            string,
-            nc_channels._nc_channels
-            if nc_channels is not None else nc_channels,
-        )
+        :param int lines_num: How many lines to scroll
+        """
+        self.scroll_to(self._scroll_offset + lines_num)
+
+    def scroll_down(self, lines_num: int = 1) -> None:
+        """
+        Scrolls the view towards newer lines.
+
+        :param int lines_num: How many lines to scroll
+        """
+        self.scroll_to(self._scroll_offset - lines_num)
+
+    def scroll_to(self, scroll_offset: int) -> None:
+        """
+        Shows the lines scrolled back from the newest line.
+
+        :param int scroll_offset: 0 shows the newest lines
+        """
+        scroll_offset = max(0, min(scroll_offset, self._max_scroll_offset()))
+        if scroll_offset == self._scroll_offset:
+            return
+
+        self._scroll_offset = scroll_offset
+        self.redraw()
+
+    def redraw(self) -> None:
+        """Draws the visible lines of backlog again."""
+        rows_num, cols_num = self.plane.dimensions_yx
+        visible_lines = [
+            line[:cols_num]
+            for line in islice(reversed(self._backlog),
+                               self._scroll_offset,
+                               self._scroll_offset + rows_num)
+        ]
+        visible_lines.reverse()
+        self.plane.erase()
+        for row, line in enumerate(visible_lines):
+            self.plane.putstr(line, row, 0)
+        self._rows_drawn = len(visible_lines)
+
+    def clear(self) -> None:
+        """Removes all lines."""
+        self._backlog.clear()
+        self._scroll_offset = 0
+        self._rows_drawn = 0
+        self.plane.erase()
+
+    def _max_scroll_offset(self) -> int:
+        rows_num, _ = self.plane.dimensions_yx
+        return max(0, len(self._backlog) - rows_num)
+
+
+class NcVirtualList:
+    """
+    List of rows that only draws rows visible on screen
+
+    Rows are requested from the fetch function when they come into view
+    and a small cache of them is kept. Only screen rows whose text
+    changed are drawn again, so the cost of scrolling depends on
+    the height of the list and not on the number of rows.
+
+    :ivar NcPlane plane: Sub plane the rows are drawn on
+    """
+
+    def __init__(
+        self,
+        parent: NcPlane,
+        row_count: int,
+        fetch_row: Callable[[int], str],
+        y_pos: int = 0,
+        x_pos: int = 0,
+        rows_num: Optional[int] = None,
+        cols_num: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ) -> None:
+        """
+        Creates a list in a sub plane of parent plane
+
+        :param NcPlane parent: Parent plane
+        :param int row_count: Number of rows in the list
+        :param fetch_row: Function that returns text of row by its index
+        :param int y_pos: top left corner Y coordinate
+            relative to top left corner of parent
+        :param int x_pos: top left corner X coordinate
+            relative to top left corner of parent
+        :param int rows_num: Number of rows (i.e. Y size)
+        :param int cols_num: Number of columns (i.e. X size)
+        :param int cache_size: Number of fetched rows to remember.
+            Defaults to three times the height of plane.
+        """
+        self.plane = parent.create_sub_plane(
+            y_pos, x_pos, rows_num, cols_num)
+        self._fetch_row = fetch_row
+        self._row_count = row_count
+        self._top_row = 0
+
+        height, _ = self.plane.dimensions_yx
+        self._cache_size = (cache_size if cache_size is not None
+                            else height * 3)
+        self._cache: OrderedDict[int, str] = OrderedDict()
+        self._drawn: List[Optional[str]] = [None] * height
+
+        self.refresh()
 
     @property
-    def dimensions_yx(self) -> Tuple[int, int]:
+    def row_count(self) -> int:
         """
-        Returns Y and X dimensions of the plane
+        Number of rows in the list
 
-        :rtype: Tuple[int, int]
+        :rtype: int
         """
-        return (_nc_direct_get_dim_y(self._nc_direct),
-                _nc_direct_get_dim_x(self._nc_direct))
+        return self._row_count
+
+    @row_count.setter
+    def row_count(self, row_count: int) -> None:
+        self._row_count = row_count
+        self._cache.clear()
+        self._top_row = max(0, min(self._top_row, self._max_top_row()))
+        self.refresh()
 
     @property
-    def cursor_enabled(self) -> Optional[bool]:
+    def top_row(self) -> int:
+        """
+        Index of the row shown at the top of plane
+
+        :rtype: int
         """
-        Is the cursor enabled?
+        return self._top_row
 
-        Assign boolean to enable or disable cursor.
+    def scroll_to(self, top_row: int) -> None:
+        """
+        Shows rows starting from the given index.
 
-        :type: bool
-        :rtype: bool
+        :param int top_row: Index of row to show at the top
+        """
+        top_row = max(0, min(top_row, self._max_top_row()))
+        if top_row == self._top_row:
+            return
+
+        self._top_row = top_row
+        self.refresh()
+
+    def scroll_by(self, rows_num: int) -> None:
+        """
+        Scrolls the list by number of rows.
+
+        :param int rows_num: Rows to scroll. Negative scrolls up.
         """
-        return self._is_cursor_enabled
+        self.scroll_to(self._top_row + rows_num)
 
-    @cursor_enabled.setter
-    def cursor_enabled(self, set_to_what: Optional[bool]) -> None:
-        self._is_cursor_enabled = set_to_what
-        if set_to_what:
-            _nc_direct_enable_cursor(self._nc_direct)
+    def invalidate(self, row_index: Optional[int] = None) -> None:
+        """
+        Forgets the cached text of row so it is fetched again.
+
+        Call :py:meth:`refresh` to draw the changes.
+
+        :param int row_index: Row to forget. None forgets all rows.
+        """
+        if row_index is None:
+            self._cache.clear()
         else:
-            _nc_direct_disable_cursor(self._nc_direct)
+            self._cache.pop(row_index, None)
+
+    def refresh(self) -> None:
+        """Draws visible rows whose text changed."""
+        height, width = self.plane.dimensions_yx
+        if len(self._drawn) != height:
+            self._drawn = [None] * height
+
+        for screen_row in range(height):
+            row_index = self._top_row + screen_row
+            if row_index < self._row_count:
+                text = self._get_row(row_index)[:width].ljust(width)
+            else:
+                text = ' ' * width
+
+            if self._drawn[screen_row] != text:
+                self.plane.putstr(text, screen_row, 0)
+                self._drawn[screen_row] = text
+
+    def _get_row(self, row_index: int) -> str:
+        try:
+            text = self._cache[row_index]
+        except KeyError:
+            text = self._fetch_row(row_index)
+            self._cache[row_index] = text
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(row_index)
+
+        return text
 
+    def _max_top_row(self) -> int:
+        height, _ = self.plane.dimensions_yx
+        return max(0, self._row_count - height)
 
-class NcInputCodes(IntEnum):
+
+_default_context: Optional[NotcursesContext] = None
+
+
+def get_std_plane() -> NcPlane:
     """
-    Enum containing special keys mapping
-
-    :cvar INVALID:
-    :cvar UP:
-    :cvar RESIZE:
-    :cvar RIGHT:
-    :cvar DOWN:
-    :cvar LEFT:
-    :cvar INSERT:
-    :cvar DELETE:
-    :cvar BACKSPACE:
-    :cvar PAGE_DOWN:
-    :cvar PAGE_UP:
-    :cvar HOME:
-    :cvar EBD:
-    :cvar F0:
-    :cvar F1:
-    :cvar F2:
-    :cvar F3:
-    :cvar F4:
-    :cvar F5:
-    :cvar F6:
-    :cvar F7:
-    :cvar F8:
-    :cvar F9:
-    :cvar F10:
-    :cvar F11:
-    :cvar F12:
-    :cvar ENTER:
-    :cvar CAPS_LOCL:
-    :cvar DOWN_LEFT:
-    :cvar DOWN_RIGHT:
-    :cvar UP_LEFT:
-    :cvar UP_RIGHT:
-    :cvar CENTER:
-    :cvar BEGIN:
-    :cvar CANCEL:
-    :cvar CLOSE:
-    :cvar COMMAND:
-    :cvar COPY:
-    :cvar EXIT:
-    :cvar PRINT:
-    :cvar REFRESH:
-    :cvar MOUSE_LEFT_BUTTON:
-    :cvar MOUSE_MIDDLE_BUTTON:
-    :cvar MOUSE_RIGHT_BUTTON:
-    :cvar MOUSE_SCROLL_UP:
-    :cvar MOUSE_SCROLL_DOWN:
-    :cvar MOUSE_6:
-    :cvar MOUSE_RELEASE:
+    Initializes context and returns the standard plane.
+
+    .. warning::
+        The terminal will be acquired by notcurses and uncontrollable until
+        the standard plane will be dereferenced.
+
+    :return: Standard plane of the terminal
+    :rtype: NcPlane
     """
-    INVALID = _notcurses.NCKEY_INVALID
-    UP = _notcurses.NCKEY_UP
-    RESIZE = _notcurses.NCKEY_RESIZE
-    RIGHT = _notcurses.NCKEY_RIGHT
-    DOWN = _notcurses.NCKEY_DOWN
-    LEFT = _notcurses.NCKEY_LEFT
-    INSERT = _notcurses.NCKEY_INS
-    DELETE = _notcurses.NCKEY_DEL
-    BACKSPACE = _notcurses.NCKEY_BACKSPACE
-    PAGE_DOWN = _notcurses.NCKEY_PGDOWN
-    PAGE_UP = _notcurses.NCKEY_PGUP
-    HOME = _notcurses.NCKEY_HOME
-    EBD = _notcurses.NCKEY_END
-    F0 = _notcurses.NCKEY_F00
-    F1 = _notcurses.NCKEY_F01
-    F2 = _notcurses.NCKEY_F02
-    F3 = _notcurses.NCKEY_F03
-    F4 = _notcurses.NCKEY_F04
-    F5 = _notcurses.NCKEY_F05
-    F6 = _notcurses.NCKEY_F06
-    F7 = _notcurses.NCKEY_F07
-    F8 = _notcurses.NCKEY_F08
-    F9 = _notcurses.NCKEY_F09
-    F10 = _notcurses.NCKEY_F10
-    F11 = _notcurses.NCKEY_F11
-    F12 = _notcurses.NCKEY_F12
-    ENTER = _notcurses.NCKEY_ENTER
-    CAPS_LOCL = _notcurses.NCKEY_CLS
-    DOWN_LEFT = _notcurses.NCKEY_DLEFT
-    DOWN_RIGHT = _notcurses.NCKEY_DRIGHT
-    UP_LEFT = _notcurses.NCKEY_ULEFT
-    UP_RIGHT = _notcurses.NCKEY_URIGHT
-    CENTER = _notcurses.NCKEY_CENTER
-    BEGIN = _notcurses.NCKEY_BEGIN
-    CANCEL = _notcurses.NCKEY_CANCEL
-    CLOSE = _notcurses.NCKEY_CLOSE
-    COMMAND = _notcurses.NCKEY_COMMAND
-    COPY = _notcurses.NCKEY_COPY
-    EXIT = _notcurses.NCKEY_EXIT
-    PRINT = _notcurses.NCKEY_PRINT
-    REFRESH = _notcurses.NCKEY_REFRESH
-    MOUSE_LEFT_BUTTON = _notcurses.NCKEY_BUTTON1
-    MOUSE_MIDDLE_BUTTON = _notcurses.NCKEY_BUTTON2
-    MOUSE_RIGHT_BUTTON = _notcurses.NCKEY_BUTTON3
-    MOUSE_SCROLL_UP = _notcurses.NCKEY_SCROLL_UP
-    MOUSE_SCROLL_DOWN = _notcurses.NCKEY_SCROLL_DOWN
-    MOUSE_6 = _notcurses.NCKEY_BUTTON6
-    MOUSE_RELEASE = _notcurses.NCKEY_RELEASE
-
-
-NC_INPUT_CODES: Dict[int, NcInputCodes] = {
-    element.value: element for element in NcInputCodes
-}
+    global _default_context
+    if _default_context is None:
+        _default_context = NotcursesContext()
+
+    std_plane_ref = _notcurses_context_get_std_plane(
+        _default_context._nc_context)
+    return NcPlane(std_plane_ref, _default_context)
+
+
+@lru_cache(maxsize=None)
+def _get_nc_input_codes_map() -> Dict[int, NcInputCodes]:
+    from .input_codes import NC_INPUT_CODES
+    return NC_INPUT_CODES
+
+
+def __getattr__(name: str) -> object:
+    if name in ('NcInputCodes', 'NC_INPUT_CODES'):
+        from . import input_codes
+        return getattr(input_codes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")